@@ -11,12 +11,12 @@ from .argument_parser import getParser  # noqa: F401
 from .argument_parser import seamm_parser  # noqa: F401
 from .compact_json_encoder import CompactJSONEncoder  # noqa: F401
 from .configuration import Configuration  # noqa: F401
-from .elemental_data import element_data  # noqa: F401
 from .check_executable import check_executable  # noqa: F401
 from .dictionary import Dictionary  # noqa: F401
 from .list_definition import parse_list  # noqa: F401
 from .units import ureg, Q_, units_class, default_units  # noqa: F401
 from .include_open import Open  # noqa: F401
+from .include_open import AsyncOpen  # noqa: F401
 from .include_open import splitext  # noqa: F401
 from .seamm_json import JSONDecoder  # noqa: F401
 from .seamm_json import JSONEncoder  # noqa: F401
@@ -36,3 +36,12 @@ versions = get_versions()
 __version__ = versions["version"]
 __git_revision__ = versions["full-revisionid"]
 del get_versions, versions
+
+
+def __getattr__(name):
+    """Load the large table of elemental data only when it is used."""
+    if name == "element_data":
+        from .elemental_data import element_data
+
+        return element_data
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
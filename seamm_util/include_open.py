@@ -2,11 +2,20 @@
 
 """Context manager for extending file reading to handle include's"""
 
+from array import array
+import asyncio
 import bz2
 import collections
+import functools
 import gzip
+import hashlib
+import json
 import logging
+import mmap
 from pathlib import Path
+import sys
+
+from .write_behind import replace_file, temporary_path
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +27,26 @@ def default_uri_handler(path):
     return Path(path)
 
 
+@functools.lru_cache(maxsize=4096)
+def _resolve(uri_handler, parent, filename, mtime):
+    """Resolve an included filename to the path of an existing file.
+
+    The result is cached for the process, keyed on the including file and its
+    modification time as well as the filename and URI handler, so an edited
+    file is resolved afresh. Missing files are not cached.
+    """
+    path = parent.parent / uri_handler(filename)
+    # Check that the file exists in case the URI handler doesn't
+    if not path.exists():
+        raise FileNotFoundError(str(path))
+    return path.expanduser().resolve()
+
+
+def clear_include_cache():
+    """Forget all the cached resolutions of include directives."""
+    _resolve.cache_clear()
+
+
 def splitext(path):
     """
     Get the extension of a file, ignoring .gz or .bz2 on the end
@@ -36,6 +65,257 @@ def splitext(path):
     return ext
 
 
+class MappedFile(object):
+    """A read-only, memory-mapped file, read as lines of bytes.
+
+    This is used by :class:`Open` for uncompressed files opened in binary mode.
+    Lines are returned as bytes without any decoding, and :meth:`view` gives a
+    zero-copy memoryview of a block of lines for numeric parsers.
+    """
+
+    def __init__(self, path):
+        self._fd = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._fd.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            self._mmap = None
+            self._buffer = b""
+        else:
+            self._buffer = self._mmap
+        self._pos = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = self.readline()
+        if line == b"":
+            raise StopIteration()
+        return line
+
+    def close(self):
+        """Unmap and close the file."""
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Views are still in use, so the map is freed when they are.
+                pass
+            self._mmap = None
+        self._buffer = b""
+        self._fd.close()
+
+    def readline(self):
+        """The next line, as bytes including the newline."""
+        end = self._buffer.find(b"\n", self._pos)
+        end = len(self._buffer) if end < 0 else end + 1
+        line = self._buffer[self._pos : end]
+        self._pos = end
+        return line
+
+    def seek(self, offset):
+        """Go to the given byte offset."""
+        self._pos = offset
+        return offset
+
+    def tell(self):
+        """The current byte offset."""
+        return self._pos
+
+    def view(self, n=None):
+        """A memoryview of the next n lines, without copying.
+
+        Parameters
+        ----------
+        n : int (optional)
+            The number of lines. Defaults to the rest of the file.
+
+        Returns
+        -------
+        (memoryview, int)
+            The view of the lines and the number of lines in it, which is less
+            than n at the end of the file.
+        """
+        start = self._pos
+        size = len(self._buffer)
+        count = 0
+        end = start
+        while (n is None or count < n) and end < size:
+            end = self._buffer.find(b"\n", end)
+            end = size if end < 0 else end + 1
+            count += 1
+        self._pos = end
+        return memoryview(self._buffer)[start:end], count
+
+
+class LineIndex(object):
+    """The byte offset of every line in a file and the files it includes.
+
+    The index covers the lines as they are returned by :class:`Open`, i.e. with
+    the include directives replaced by the contents of the included files. Each
+    line records the *frame* it is in, which is one particular inclusion of a
+    file, together with the byte offset and line number of the line in that
+    file. The frames record their parent frame and the position just after the
+    include directive, which is enough to rebuild the stack of open files at
+    any line.
+
+    For compressed files the offsets are into the uncompressed data.
+    """
+
+    version = 3
+    suffix = ".lidx"
+
+    def __init__(self, include="#include"):
+        self.include = include
+        self.paths = []  # The files in the include tree
+        self.stamps = []  # (st_mtime_ns, st_size) for each of the files
+        # (parent frame, file id, lineno, offset, total lines) for each frame
+        self.frames = []
+        self.names = []  # The filename in the include directive of each frame
+        self.unterminated = []  # The lines without a newline, at ends of files
+        self.frame = array("q")
+        self.offset = array("q")
+        self.lineno = array("q")
+        self.total = array("q")
+        self.total_lines = 0  # Including the include directives
+        self._file_id = {}
+
+    def __len__(self):
+        """The number of lines in the index."""
+        return len(self.frame)
+
+    def add_path(self, path):
+        """Add a file to the index, returning its id."""
+        if path not in self._file_id:
+            stat = path.stat()
+            self._file_id[path] = len(self.paths)
+            self.paths.append(path)
+            self.stamps.append((stat.st_mtime_ns, stat.st_size))
+        return self._file_id[path]
+
+    def add_frame(self, parent, file_id, lineno, offset, total, name=""):
+        """Add an inclusion of a file, returning the id of the frame."""
+        self.frames.append((parent, file_id, lineno, offset, total))
+        self.names.append(name)
+        return len(self.frames) - 1
+
+    def add_line(self, frame, offset, lineno, total):
+        """Add a line to the index."""
+        self.frame.append(frame)
+        self.offset.append(offset)
+        self.lineno.append(lineno)
+        self.total.append(total)
+
+    def file_id(self, n):
+        """The id of the file containing line n."""
+        return self.frames[self.frame[n]][1]
+
+    def stack(self, n):
+        """The files and line numbers of the include stack at line n.
+
+        Returns
+        -------
+        [(pathlib.Path, int)]
+            The path and line number of each file, from the top-level file
+            down to the file containing the line.
+        """
+        result = [(self.paths[self.file_id(n)], self.lineno[n])]
+        frame = self.frame[n]
+        while True:
+            parent, file_id, lineno, offset, total = self.frames[frame]
+            if parent < 0:
+                break
+            result.append((self.paths[self.frames[parent][1]], lineno))
+            frame = parent
+        result.reverse()
+        return result
+
+    def is_current(self):
+        """Whether all the files are unchanged since the index was made."""
+        for path, stamp in zip(self.paths, self.stamps):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                return False
+            if (stat.st_mtime_ns, stat.st_size) != tuple(stamp):
+                return False
+        return True
+
+    @classmethod
+    def sidecar(cls, path):
+        """The path of the file to save the index of 'path' in."""
+        return path.with_name(path.name + cls.suffix)
+
+    def save(self, path):
+        """Write the index to disk.
+
+        Parameters
+        ----------
+        path : pathlib.Path
+            The file to write.
+        """
+        header = {
+            "version": self.version,
+            "byteorder": sys.byteorder,
+            "include": self.include,
+            "paths": [str(p) for p in self.paths],
+            "stamps": self.stamps,
+            "frames": self.frames,
+            "names": self.names,
+            "unterminated": self.unterminated,
+            "n_lines": len(self),
+            "total_lines": self.total_lines,
+        }
+        tmp = temporary_path(path)
+        with open(tmp, "wb") as fd:
+            fd.write(json.dumps(header).encode() + b"\n")
+            for data in (self.frame, self.offset, self.lineno, self.total):
+                data.tofile(fd)
+        replace_file(tmp, path)
+
+    @classmethod
+    def load(cls, path, include="#include"):
+        """Read an index from disk, returning None if it is missing or stale.
+
+        Parameters
+        ----------
+        path : pathlib.Path
+            The file to read.
+        include : str
+            The include keyword that the index must have been made with.
+
+        Returns
+        -------
+        LineIndex or None
+        """
+        try:
+            with open(path, "rb") as fd:
+                header = json.loads(fd.readline())
+                if (
+                    header["version"] != cls.version
+                    or header["byteorder"] != sys.byteorder
+                    or header["include"] != include
+                ):
+                    return None
+                index = cls(include=include)
+                n = header["n_lines"]
+                for data in (index.frame, index.offset, index.lineno, index.total):
+                    data.fromfile(fd, n)
+        except (OSError, ValueError, KeyError, EOFError):
+            return None
+        index.paths = [Path(p) for p in header["paths"]]
+        index.stamps = [tuple(s) for s in header["stamps"]]
+        index.frames = [tuple(f) for f in header["frames"]]
+        index.names = header["names"]
+        index.unterminated = header["unterminated"]
+        index.total_lines = header["total_lines"]
+        index._file_id = {p: i for i, p in enumerate(index.paths)}
+        if not index.is_current():
+            return None
+        return index
+
+
 class Open(object):
     def __init__(
         self,
@@ -45,6 +325,9 @@ class Open(object):
         include="#include",
         history=10,
         uri_handler=None,
+        index=False,
+        persist_index=False,
+        expand_cache=None,
     ):
         """Open a file, automatically handling 'include'
 
@@ -53,7 +336,8 @@ class Open(object):
         path : str or pathlib.Path
             The path to the file
         mode : str (optional)
-            The mode to open the file. Defaults to read-only.
+            The mode to open the file. Defaults to read-only. With "rb" the
+            lines are bytes, and uncompressed files are memory-mapped.
         logger : logging.Logger (optional)
             The logging object to use
         include : str (optional)
@@ -62,12 +346,28 @@ class Open(object):
             Length of history to keep
         uri_handler : function (optional)
             A method to handle any URIs, like 'local:'. Defaults to None.
+        index : bool (optional)
+            Build the line index when the file is opened rather than when it is
+            first needed by :meth:`seek_line` or slicing. Defaults to False.
+        persist_index : bool (optional)
+            Save the line index next to the file as <file>.lidx, and reuse it
+            if none of the files have changed. Defaults to False.
+        expand_cache : str or pathlib.Path (optional)
+            A directory for caching the file with all its includes expanded.
+            The cached copy is read while none of the files have changed, with
+            the line index as a source map so that the paths, line numbers and
+            stack refer to the original files. Defaults to None, no cache.
         """
         if not isinstance(path, Path):
             path = Path(path)
         self.mode = mode
         self.logger = logger
         self.include = include
+        self._binary = "b" in mode
+        if self._binary and include is not None:
+            self._include_key = include.encode()
+        else:
+            self._include_key = include
         self._history = history
         self._depth = -1
         if uri_handler is None:
@@ -85,13 +385,32 @@ class Open(object):
         self._fds = []
         self._cwd = Path.cwd()
 
+        self._index = None
+        self._build_index = index
+        self._persist_index = persist_index
+
+        if expand_cache is not None and not isinstance(expand_cache, Path):
+            expand_cache = Path(expand_cache)
+        self._expand_cache = expand_cache
+        self._expanded = None  # The index when reading the expanded file
+        self._n = -1
+        self._frame = -1
+
     def __enter__(self):
         """Handle the enter event for the context manager by opening the file"""
         self.logger.debug("in __enter__")
+        if self._expand_cache is not None:
+            self._open_expanded()
+            self.logger.debug(f"   opened expanded copy of {self.path}")
+            return self
+
         self._linenos.append(0)
         self._fds.append(self._open(self.path))
 
         self.logger.debug(f"   opened {self.path}")
+
+        if self._build_index:
+            self.index
         return self
 
     def __exit__(self, *args, **kwargs):
@@ -111,36 +430,26 @@ class Open(object):
             self._depth -= 1
             return line
 
+        if self._expanded is not None:
+            line = self._next_expanded()
+            self._deque.appendleft(line)
+            return line
+
         line = self._next()
         words = line.split()
-        if self.include is not None and len(words) > 0 and words[0] == self.include:
-            if len(words) > 2:
-                filename, tmp = words[1:3]
-                missing_ok = tmp.lower() == "missing_ok"
-            else:
-                filename = words[1]
-                missing_ok = False
-            self.logger.debug("   opening include file {}".format(filename))
-            self._linenos.append(0)
-            try:
-                path = self.path.parent / self._uri_handler(filename)
-            except FileNotFoundError:
-                self.logger.debug("   URI handler did not find the file")
-                if not missing_ok:
-                    raise
-            else:
-                # only use a file once
-                if path not in self.visited:
-                    # Check that the file exists in case the URI handler doesn't
-                    if path.exists():
-                        self._paths.append(path.expanduser().resolve())
-                        self._fds.append(self._open(self.path))
-                        self.logger.debug("   opened it")
-                        self.visited.append((filename, path))
-                    elif missing_ok:
-                        pass
-                    else:
-                        raise FileNotFoundError(str(path))
+        if (
+            self.include is not None
+            and len(words) > 0
+            and words[0] == self._include_key
+        ):
+            if self._binary:
+                words = [word.decode() for word in words]
+            path = self._resolve_include(self._paths, words, self._visited)
+            if path is not None:
+                self._linenos.append(0)
+                self._paths.append(path)
+                self._fds.append(self._open(self.path))
+                self.logger.debug("   opened it")
             line = self.__next__()
         self.logger.log(0, line)
 
@@ -151,6 +460,64 @@ class Open(object):
         """Need to be an iterator"""
         return self
 
+    def __getitem__(self, key):
+        """Random access to the lines, or slices of them, using the line index.
+
+        Lines are numbered from 0 across the whole include tree, in the order
+        they are returned when iterating. This does not change the position of
+        the iterator.
+        """
+        index = self.index
+        n_lines = len(index)
+        if isinstance(key, slice):
+            lines = range(*key.indices(n_lines))
+        else:
+            if key < 0:
+                key += n_lines
+            if key < 0 or key >= n_lines:
+                raise IndexError("line index out of range")
+            lines = (key,)
+
+        result = list(self._read_lines(lines, self._open))
+
+        if isinstance(key, slice):
+            return result
+        return result[0]
+
+    def _read_lines(self, lines, opener):
+        """Read the given lines from the original files using the index.
+
+        Parameters
+        ----------
+        lines : iterable of int
+            The numbers of the lines to read.
+        opener : function
+            The function to open the files with.
+        """
+        index = self.index
+        fds = {}
+        last = {}
+        try:
+            for n in lines:
+                file_id = index.file_id(n)
+                if file_id not in fds:
+                    fds[file_id] = opener(index.paths[file_id])
+                    last[file_id] = None
+                fd = fds[file_id]
+                # Adjacent lines in the same frame don't need a seek
+                m = last[file_id]
+                if (
+                    m is None
+                    or index.frame[m] != index.frame[n]
+                    or index.lineno[m] + 1 != index.lineno[n]
+                ):
+                    fd.seek(index.offset[n])
+                yield fd.readline()
+                last[file_id] = n
+        finally:
+            for fd in fds.values():
+                self._close(fd)
+
     def __getattr__(self, attr):
         """Pass any attribute requests to the actual file handle"""
         self.logger.debug("attr = '{}'".format(attr))
@@ -174,6 +541,20 @@ class Open(object):
         """The paths of all the opened files."""
         return self._paths
 
+    @property
+    def index(self):
+        """The line index for the file and its includes, made when needed."""
+        if self._index is None:
+            root = self._visited[0][1]
+            sidecar = LineIndex.sidecar(root)
+            if self._persist_index:
+                self._index = LineIndex.load(sidecar, include=self.include)
+            if self._index is None:
+                self._index = self._make_index(root)
+                if self._persist_index:
+                    self._index.save(sidecar)
+        return self._index
+
     @property
     def lineno(self):
         """THe line number in the current file."""
@@ -197,6 +578,63 @@ class Open(object):
             raise RuntimeError("Exceeded the currently available history")
         self._depth += n
 
+    def seek_line(self, n):
+        """Position the file so that the next line returned is line n.
+
+        Lines are numbered from 0 across the whole include tree, in the order
+        they are returned when iterating. The stack of included files, line
+        numbers and total lines are restored, but the history is cleared.
+
+        Parameters
+        ----------
+        n : int
+            The line to go to. Negative numbers count from the end.
+        """
+        index = self.index
+        n_lines = len(index)
+        if n < 0:
+            n += n_lines
+        if n < 0 or n >= n_lines:
+            raise IndexError("line index out of range")
+
+        # The chain of frames from the top file down to the line
+        chain = []
+        frame = index.frame[n]
+        while frame >= 0:
+            chain.append(frame)
+            frame = index.frames[frame][0]
+        chain.reverse()
+
+        while len(self._fds) > 0:
+            self._close(self._fds.pop())
+        self._paths = []
+        self._linenos = []
+
+        # Each file is positioned just after the include of the next one
+        positions = [index.frames[frame][2:4] for frame in chain[1:]]
+        positions.append((index.lineno[n] - 1, index.offset[n]))
+        for frame, (lineno, offset) in zip(chain, positions):
+            path = index.paths[index.frames[frame][1]]
+            fd = self._open(path)
+            if offset != 0:
+                fd.seek(offset)
+            self._paths.append(path)
+            self._fds.append(fd)
+            self._linenos.append(lineno)
+
+        # The files used so far are those included before line n; frames are
+        # in reading order and record the total lines at their include.
+        self._visited = []
+        for frame, name in zip(index.frames, index.names):
+            if frame[4] >= index.total[n]:
+                break
+            self._visited.append((name, index.paths[frame[1]]))
+
+        self._total_lines = index.total[n] - 1
+        self._deque.clear()
+        self._depth = -1
+        self._expanded = None
+
     def stack(self):
         """Provide the traceback of the included files"""
         result = []
@@ -204,6 +642,34 @@ class Open(object):
             result.append(f"{path}:{lineno}")
         return result
 
+    def view(self, n=None):
+        """A zero-copy view of the next n lines of the current file.
+
+        This is only available in binary mode for uncompressed files. The lines
+        are taken directly from the current file, so include directives in them
+        are not processed, and the view does not go into the history. The line
+        counts are updated.
+
+        Parameters
+        ----------
+        n : int (optional)
+            The number of lines. Defaults to the rest of the current file.
+
+        Returns
+        -------
+        memoryview
+            The lines, including their newlines.
+        """
+        fd = self._fds[-1]
+        if not isinstance(fd, MappedFile):
+            raise RuntimeError("view() needs an uncompressed file opened with 'rb'")
+        if self._depth >= 0:
+            raise RuntimeError("view() cannot be used with lines pushed back")
+        result, count = fd.view(n)
+        self._linenos[-1] += count
+        self._total_lines += count
+        return result
+
     def _close(self, fd, *args, **kwargs):
         """Helper routine to close a file handle"""
         exit = getattr(fd, "__exit__", None)
@@ -216,6 +682,114 @@ class Open(object):
                 self.logger.debug("   closing fd using its close method")
                 exit()
 
+    def _make_index(self, root):
+        """Make the line index by reading the files once, in binary.
+
+        Parameters
+        ----------
+        root : pathlib.Path
+            The top-level file.
+        """
+        index = LineIndex(include=self.include)
+        include = None if self.include is None else self.include.encode()
+        visited = [("", root)]
+
+        fds = [self._open_binary(root)]
+        frames = [index.add_frame(-1, index.add_path(root), 0, 0, 0)]
+        paths = [root]
+        offsets = [0]
+        linenos = [0]
+        total = 0
+        try:
+            while len(fds) > 0:
+                line = fds[-1].readline()
+                if line == b"":
+                    self._close(fds.pop())
+                    for tmp in (frames, paths, offsets, linenos):
+                        tmp.pop()
+                    continue
+                offset = offsets[-1]
+                offsets[-1] += len(line)
+                linenos[-1] += 1
+                total += 1
+
+                words = line.split()
+                if include is not None and len(words) > 0 and words[0] == include:
+                    words = [word.decode() for word in words]
+                    path = self._resolve_include(paths, words, visited)
+                    if path is not None:
+                        file_id = index.add_path(path)
+                        frames.append(
+                            index.add_frame(
+                                frames[-1],
+                                file_id,
+                                linenos[-1],
+                                offsets[-1],
+                                total,
+                                name=words[1],
+                            )
+                        )
+                        fds.append(self._open_binary(path))
+                        paths.append(path)
+                        offsets.append(0)
+                        linenos.append(0)
+                else:
+                    if not line.endswith(b"\n"):
+                        index.unterminated.append(len(index))
+                    index.add_line(frames[-1], offset, linenos[-1], total)
+        finally:
+            while len(fds) > 0:
+                self._close(fds.pop())
+
+        index.total_lines = total
+        self.logger.debug(f"   indexed {len(index)} lines in {len(index.paths)} files")
+        return index
+
+    def _next_expanded(self):
+        """Get the next line from the expanded file, using the source map."""
+        index = self._expanded
+        try:
+            line = self._fds[-1].__next__()
+        except StopIteration:
+            self._close(self._fds.pop())
+            self._paths = []
+            self._linenos = []
+            self._total_lines = index.total_lines
+            self._visit_frames(index.total_lines + 1)
+            raise
+
+        n = self._n = self._n + 1
+        if n in self._unterminated:
+            line = line[:-1]
+        frame = index.frame[n]
+        if frame == self._frame:
+            self._linenos[-1] = index.lineno[n]
+        else:
+            self._frame = frame
+            self._visit_frames(index.total[n])
+            stack = index.stack(n)
+            self._paths = [path for path, lineno in stack]
+            self._linenos = [lineno for path, lineno in stack]
+        self._total_lines = index.total[n]
+
+        return line
+
+    def _visit_frames(self, total):
+        """Add the includes read before the given line to the files used.
+
+        Parameters
+        ----------
+        total : int
+            The total number of lines read, up to and including the line.
+        """
+        index = self._expanded
+        frames = index.frames
+        k = self._n_visited
+        while k < len(frames) and frames[k][4] < total:
+            self._visited.append((index.names[k], index.paths[frames[k][1]]))
+            k += 1
+        self._n_visited = k
+
     def _next(self):
         """Helper routine to get the next line, handling EOF and errors"""
         try:
@@ -239,6 +813,144 @@ class Open(object):
 
         return line
 
+    def _open_expanded(self):
+        """Open the cached, expanded file, creating it if needed."""
+        root = self._visited[0][1]
+        # Includes are resolved by the URI handler, so it is part of the key
+        handler = self._uri_handler
+        handler = getattr(handler, "__qualname__", type(handler).__qualname__)
+        handler = f"{self._uri_handler.__module__}.{handler}"
+        key = f"{root}\n{self.include}\n{handler}"
+        key = hashlib.sha256(key.encode()).hexdigest()
+        path = self._expand_cache / (key + ".txt")
+        index_path = self._expand_cache / (key + LineIndex.suffix)
+
+        index = LineIndex.load(index_path, include=self.include)
+        if index is None or not path.exists():
+            self.logger.debug(f"   expanding {root} into {path}")
+            self._expand_cache.mkdir(parents=True, exist_ok=True)
+            self._index = index = self._make_index(root)
+            # Files without a final newline must not run into the next line
+            tmp = temporary_path(path)
+            with open(tmp, "wb") as fd:
+                for line in self._read_lines(range(len(index)), self._open_binary):
+                    fd.write(line if line.endswith(b"\n") else line + b"\n")
+            replace_file(tmp, path)
+            index.save(index_path)
+        else:
+            self._index = index
+
+        self._expanded = index
+        self._unterminated = set(index.unterminated)
+        self._n = -1
+        self._frame = -1
+        self._visited = self._visited[:1]
+        self._n_visited = 1
+        self._fds.append(self._open(path))
+
+    def _open_binary(self, path):
+        """Open 'path' for reading bytes, using gzip or bzip if needed."""
+        ext = path.suffix
+        if ext == ".bz2":
+            return bz2.open(path, "rb")
+        elif ext == ".gz":
+            return gzip.open(path, "rb")
+        else:
+            return open(path, "rb")
+
+    def _resolve_include(self, stack, words, visited):
+        """Work out the file named by an include directive.
+
+        A file may be included any number of times, but not inside itself.
+
+        Parameters
+        ----------
+        stack : [pathlib.Path]
+            The paths of the files being read, ending with the file containing
+            the directive.
+        words : [str]
+            The words of the include line.
+        visited : [(str, pathlib.Path)]
+            The includes used so far, which is updated.
+
+        Returns
+        -------
+        pathlib.Path or None
+            The resolved path of the file to read, or None if there is none.
+        """
+        if len(words) > 2:
+            filename, tmp = words[1:3]
+            missing_ok = tmp.lower() == "missing_ok"
+        else:
+            filename = words[1]
+            missing_ok = False
+        self.logger.debug("   opening include file {}".format(filename))
+        parent = stack[-1]
+        try:
+            path = _resolve(
+                self._uri_handler, parent, filename, parent.stat().st_mtime_ns
+            )
+            # The cache is keyed on the parent, so check the file is still there
+            if not path.exists():
+                raise FileNotFoundError(str(path))
+        except FileNotFoundError:
+            self.logger.debug("   did not find the file")
+            if not missing_ok:
+                raise
+            return None
+
+        # A file including itself would never end
+        if path in stack:
+            self.logger.warning(f"Ignoring the recursive include of {path} in {parent}")
+            return None
+        visited.append((filename, path))
+        return path
+
+    def include_graph(self):
+        """Resolve all the includes in the file and the files it includes.
+
+        This reads just the include directives, following them in the same
+        order and with the same rules as reading the file, which also fills the
+        cache of resolved includes for later reads.
+
+        Returns
+        -------
+        {pathlib.Path: [pathlib.Path]}
+            The files included directly by each file in the tree, starting with
+            the top-level file.
+        """
+        root = self._visited[0][1]
+        include = None if self.include is None else self.include.encode()
+        visited = [("", root)]
+        graph = {root: []}
+
+        stack = [(root, self._open_binary(root))]
+        try:
+            while len(stack) > 0:
+                parent, fd = stack[-1]
+                line = fd.readline() if include is not None else b""
+                if line == b"":
+                    self._close(fd)
+                    stack.pop()
+                    continue
+                if include not in line:
+                    continue
+                words = line.split()
+                if len(words) > 0 and words[0] == include:
+                    words = [word.decode() for word in words]
+                    paths = [path for path, fd in stack]
+                    path = self._resolve_include(paths, words, visited)
+                    if path is not None:
+                        graph[parent].append(path)
+                        # The includes of a file already read are known
+                        if path not in graph:
+                            graph[path] = []
+                            stack.append((path, self._open_binary(path)))
+        finally:
+            for parent, fd in stack:
+                self._close(fd)
+        return graph
+
     def _open(self, path):
         """Open 'filename' using gzip or bzip if needed
 
@@ -250,10 +962,207 @@ class Open(object):
         if not isinstance(path, Path):
             raise RuntimeError("path must be a pathlib.Path")
         ext = path.suffix
-        if ext == ".bz2":
+        if self._binary:
+            if ext in (".bz2", ".gz"):
+                fd = self._open_binary(path)
+            else:
+                fd = MappedFile(path)
+        elif ext == ".bz2":
             fd = bz2.open(path, self.mode + "t")
         elif ext == ".gz":
             fd = gzip.open(path, self.mode + "t")
         else:
             fd = open(path, self.mode)
         return fd
+
+
+class AsyncOpen(object):
+    def __init__(
+        self,
+        path,
+        mode="r",
+        logger=logger,
+        include="#include",
+        history=10,
+        uri_handler=None,
+        chunk_size=1000,
+        executor=None,
+    ):
+        """Open a file for asyncio, automatically handling 'include'
+
+        This wraps :class:`Open`, doing the reading and decompression in a
+        thread pool so that the event loop is not blocked. Lines are read ahead
+        in chunks while the current chunk is being used. The include, history
+        and stack semantics are the same as for :class:`Open`::
+
+            async with AsyncOpen(path) as fd:
+                async for line in fd:
+                    ...
+
+        Parameters
+        ----------
+        path : str or pathlib.Path
+            The path to the file
+        mode : str (optional)
+            The mode to open the file. Defaults to read-only.
+        logger : logging.Logger (optional)
+            The logging object to use
+        include : str (optional)
+            The keyword that triggers an include. Defaults to "#include"
+        history : int (optional)
+            Length of history to keep
+        uri_handler : function (optional)
+            A method to handle any URIs, like 'local:'. Defaults to None.
+        chunk_size : int (optional)
+            The number of lines to read ahead at a time. Defaults to 1000.
+        executor : concurrent.futures.Executor (optional)
+            The executor to read in. Defaults to the event loop's default.
+        """
+        self._open = Open(
+            path,
+            mode=mode,
+            logger=logger,
+            include=include,
+            history=history,
+            uri_handler=uri_handler,
+        )
+        self.logger = logger
+        self._chunk_size = chunk_size
+        self._executor = executor
+
+        self._buffer = collections.deque()
+        self._pending = None
+        self._eof = False
+        self._error = None
+
+        self._deque = collections.deque(maxlen=history)
+        self._depth = -1
+        # The paths, line numbers and total lines for the current line
+        self._current = ((self._open.path,), (0,), 0)
+
+    async def __aenter__(self):
+        """Open the file in the thread pool"""
+        await self._run(self._open.__enter__)
+        return self
+
+    async def __aexit__(self, *args):
+        """Close any open files as we exit the context"""
+        if self._pending is not None:
+            try:
+                await self._pending
+            except Exception:
+                pass
+            self._pending = None
+        await self._run(self._open.__exit__, *args)
+
+    def __aiter__(self):
+        """Need to be an asynchronous iterator"""
+        return self
+
+    async def __anext__(self):
+        """Asynchronous iterator to get the next line"""
+        if self._depth >= 0:
+            record = self._deque[self._depth]
+            self._depth -= 1
+            return record[0]
+
+        if len(self._buffer) == 0:
+            await self._fill()
+            if len(self._buffer) == 0:
+                if self._error is not None:
+                    error = self._error
+                    self._error = None
+                    raise error
+                raise StopAsyncIteration()
+
+        record = self._buffer.popleft()
+        self._current = record[1:]
+        self._deque.appendleft(record)
+        return record[0]
+
+    @property
+    def depth(self):
+        """The depth of the current line stack"""
+        return self._depth
+
+    @property
+    def path(self):
+        """The path of the current working file"""
+        paths = self._current[0]
+        if len(paths) > 0:
+            return paths[-1]
+        else:
+            return None
+
+    @property
+    def paths(self):
+        """The paths of all the opened files."""
+        return list(self._current[0])
+
+    @property
+    def lineno(self):
+        """The line number in the current file."""
+        linenos = self._current[1]
+        if len(linenos) > 0:
+            return linenos[-1]
+        else:
+            return 0
+
+    @property
+    def total_lines(self):
+        return self._current[2]
+
+    @property
+    def visited(self):
+        """The set of files used, which may include files read ahead."""
+        return self._open.visited
+
+    def push(self, n=1):
+        """Push the n last lines back onto the device (virtually)"""
+        if self._depth + n > len(self._deque):
+            raise RuntimeError("Exceeded the currently available history")
+        self._depth += n
+
+    def stack(self):
+        """Provide the traceback of the included files"""
+        paths, linenos, total = self._current
+        result = []
+        for path, lineno in zip(reversed(paths), reversed(linenos)):
+            result.append(f"{path}:{lineno}")
+        return result
+
+    async def _fill(self):
+        """Get the next chunk of lines, and start reading the one after."""
+        if self._pending is None:
+            if self._eof:
+                return
+            self._pending = self._run(self._read_chunk)
+        try:
+            records, self._eof, self._error = await self._pending
+        finally:
+            self._pending = None
+        self._buffer.extend(records)
+        if not self._eof:
+            self._pending = asyncio.ensure_future(self._run(self._read_chunk))
+
+    def _read_chunk(self):
+        """Read a chunk of lines, with their stacks. Runs in the thread pool."""
+        fd = self._open
+        records = []
+        try:
+            for i in range(self._chunk_size):
+                line = next(fd)
+                records.append(
+                    (line, tuple(fd.paths), tuple(fd._linenos), fd.total_lines)
+                )
+        except StopIteration:
+            return records, True, None
+        except Exception as e:
+            # Return the lines read so far and raise the error after them
+            return records, True, e
+        return records, False, None
+
+    def _run(self, function, *args):
+        """Run a function in the executor."""
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(self._executor, function, *args)
@@ -6,28 +6,87 @@ using JSON to serialize and deserialize the data.
 
 It presents the dict api with the addition of methods to serialize and
 deserialize the contents.
+
+Optionally the changes can be journaled: each flush appends just the keys
+that have changed since the last flush to <filename>.journal as a line of
+JSON. The journal is replayed when the file is read, and periodically
+compacted into the main file.
+
+Large, uncompressed files can also be read lazily: only the keys are read
+when the file is opened, using an index of where each value is in the file,
+and values are decoded as they are used. The index is kept next to the file
+as <filename>.index.
+
+Files are always replaced atomically, and the writing can be done by a
+background thread that gathers the flushes within a short window into one
+write.
 """
 
 import bz2
 import collections.abc
 import gzip
 import json
+import logging
+import mmap
+import os
 import os.path
 import pprint
+import re
+import threading
+
+from .write_behind import replace_file, temporary_path, WriteBehind
+
+logger = logging.getLogger(__name__)
+
+# Marks a value in a lazy Output that has not been read from the file yet
+_UNLOADED = object()
+
+# The tokens that matter for finding the top-level values in a JSON document
+_json_tokens = re.compile(rb'"(?:[^"\\]|\\.)*"|[{}\[\]:,]', re.DOTALL)
 
 
 class Output(collections.abc.MutableMapping):
-    def __init__(self, filename=None, **kwargs):
+    def __init__(
+        self,
+        filename=None,
+        journal=False,
+        compact_every=100,
+        lazy=False,
+        write_behind=None,
+        **kwargs,
+    ):
         """Create the Output object
 
         Keyword arguments:
             filename: the name of the file for serialization
+            journal: whether to append changes to a journal rather than
+                rewriting the whole file on each flush
+            compact_every: the number of journal records after which the
+                journal is compacted into the file
+            lazy: whether to read values from the file only when they are
+                used. Only uncompressed files are read lazily.
+            write_behind: None to write when flushed, or the time in seconds
+                to gather flushes before writing them in the background
             kwargs: any other keyword arguments initialize the dict
         """
 
         self._is_changed = False
+        self._changed = set()  # Keys set since the last flush
+        self._deleted = set()  # Keys deleted since the last flush
         self._data = dict()  # This stores the dict like data
         self._filename = None
+        self._journal = journal
+        self._compact_every = compact_every
+        self._n_records = 0
+        self._lazy = lazy
+        self._spans = {}  # The location of the values in the file
+        self._lock = threading.RLock()
+        if write_behind is None:
+            self._writer = None
+        else:
+            self._writer = WriteBehind(
+                self._save, window=write_behind, name="Output write-behind"
+            )
 
         # Set the filename, if given, which will open the file
         self.filename = filename
@@ -48,30 +107,57 @@ class Output(collections.abc.MutableMapping):
                 if self._is_changed:
                     pass
             else:
-                if self._is_changed:
-                    self.flush()
+                self.flush(wait=True)
+                self._load_all()
             self._filename = filename
 
         if self._filename is not None:
-            with self._open() as fd:
-                self._data = json.load(fd)
-            self._is_changed = False
+            self._load()
+
+    @property
+    def index_filename(self):
+        """The filename for the index of the values in a lazy file"""
+        if self._filename is None:
+            return None
+        return os.fspath(self._filename) + ".index"
+
+    @property
+    def journal_filename(self):
+        """The filename for the journal of changes"""
+        if self._filename is None:
+            return None
+        return os.fspath(self._filename) + ".journal"
 
     def __getitem__(self, key):
         """Allow [] access to the dictionary!"""
         if key not in self._data:
             raise KeyError("key '" + key + "' does not exist")
-        return self.get(key)
+        value = self._data[key]
+        if value is _UNLOADED:
+            with self._lock:
+                with open(self.filename, "rb") as fd:
+                    value = self._data[key] = self._read_value(fd, key)
+        return value
 
     def __setitem__(self, key, value):
         """Allow x[key] access to the data"""
-        self._data[key] = value
-        self._is_changed = True
+        with self._lock:
+            self._data[key] = value
+            self._changed.add(key)
+            self._deleted.discard(key)
+            self._is_changed = True
 
     def __delitem__(self, key):
         """Allow deletion of keys"""
-        del self._data[key]
-        self._is_changed = True
+        with self._lock:
+            del self._data[key]
+            self._changed.discard(key)
+            self._deleted.add(key)
+            self._is_changed = True
+
+    def __contains__(self, key):
+        """Allow 'in', without reading the value from a lazy file"""
+        return key in self._data
 
     def __iter__(self):
         """Allow iteration over the object"""
@@ -83,25 +169,333 @@ class Output(collections.abc.MutableMapping):
 
     def __repr__(self):
         """The string representation of this object"""
+        self._load_all()
         return repr(self._data)
 
     def __str__(self):
         """The pretty string representation of this object"""
+        self._load_all()
         return pprint.pformat(self._data)
 
     def copy(self):
         """Return a shallow copy of the dictionary"""
+        self._load_all()
         return self._data.copy()
 
-    def _open(self):
-        """Open self.filename, using compression according to its extension,"""
+    def compact(self):
+        """Write all the data to the file and remove the journal."""
+        if self._filename is None:
+            raise RuntimeError("Output has no filename to write to.")
+        if self._writer is not None:
+            self._writer.flush(wait=True)
+        self._compact()
+
+    def flush(self, wait=False):
+        """Save any changes to the file, or append them to the journal.
+
+        With write-behind the changes are written by the background thread
+        once the window has passed.
+
+        Keyword arguments:
+            wait: write any changes now, and wait until they are on disk
+        """
+        if self._filename is None:
+            raise RuntimeError("Output has no filename to write to.")
+        if self._writer is None:
+            self._save()
+        else:
+            if self._is_changed:
+                self._writer.request()
+            if wait:
+                self._writer.flush(wait=True)
+
+    def _clear_changes(self):
+        """Note that everything is saved."""
+        self._changed.clear()
+        self._deleted.clear()
+        self._is_changed = False
+
+    def _compact(self):
+        """Write all the data to the file and remove the journal."""
+        with self._lock:
+            data = dict(self._data)
+            self._clear_changes()
+        self._write(data)
+        if os.path.exists(self.journal_filename):
+            os.remove(self.journal_filename)
+        self._n_records = 0
+
+    def _save(self):
+        """Write the changes, either directly or in the background thread.
+
+        The changes are taken while holding the lock, so the data can be
+        changed while they are being written. If the write fails they are put
+        back to be written next time.
+        """
+        with self._lock:
+            if not self._is_changed:
+                return
+            changed = self._changed
+            deleted = self._deleted
+            self._changed = set()
+            self._deleted = set()
+            self._is_changed = False
+            if self._journal:
+                record = {}
+                if len(changed) > 0:
+                    record["set"] = {key: self._data[key] for key in changed}
+                if len(deleted) > 0:
+                    record["delete"] = sorted(deleted)
+            else:
+                data = dict(self._data)
+
+        try:
+            if self._journal:
+                with open(self.journal_filename, "a") as fd:
+                    fd.write(json.dumps(record) + "\n")
+                    fd.flush()
+                    os.fsync(fd.fileno())
+                self._n_records += 1
+                if self._n_records >= self._compact_every:
+                    self._compact()
+            else:
+                self._write(data)
+        except Exception:
+            with self._lock:
+                for key in changed:
+                    if key in self._data and key not in self._deleted:
+                        self._changed.add(key)
+                for key in deleted:
+                    if key not in self._data:
+                        self._deleted.add(key)
+                self._is_changed = True
+            raise
+
+    def _is_lazy(self):
+        """Whether the file can be read lazily."""
+        if not self._lazy:
+            return False
+        extension = os.path.splitext(self.filename)[1].strip().lower()
+        return extension not in (".bz2", ".gz")
+
+    def _load(self):
+        """Read the file, if it exists, and replay any journal.
+
+        If the file does not exist, any data already present, e.g. from the
+        previous file, is kept and all written on the next flush.
+        """
+        self._spans = {}
+        exists = os.path.exists(self.filename)
+        if exists:
+            spans = self._read_index() if self._is_lazy() else None
+            if spans is None:
+                with self._open() as fd:
+                    self._data = json.load(fd)
+            else:
+                self._spans = spans
+                self._data = dict.fromkeys(spans, _UNLOADED)
+        self._n_records = 0
+        if self._journal:
+            self._replay()
+        self._clear_changes()
+        if not exists and len(self._data) > 0:
+            self._changed = set(self._data)
+            self._is_changed = True
+
+    def _load_all(self):
+        """Read any values not yet read from a lazy file."""
+        keys = [key for key, value in self._data.items() if value is _UNLOADED]
+        if len(keys) > 0:
+            with open(self.filename, "rb") as fd:
+                for key in keys:
+                    self._data[key] = self._read_value(fd, key)
+
+    def _read_index(self):
+        """Get the location of each top-level value in the file.
+
+        The index is read from <filename>.index if it is up-to-date, otherwise
+        the file is scanned and the index saved.
+
+        Returns
+        -------
+        {str: (int, int)} or None
+            The start and end byte of each value, or None if the file is not
+            a JSON object.
+        """
+        stat = os.stat(self.filename)
+        stamp = [stat.st_size, stat.st_mtime_ns]
+        try:
+            with open(self.index_filename, "r") as fd:
+                index = json.load(fd)
+            if index["stamp"] == stamp:
+                return {key: tuple(span) for key, span in index["spans"].items()}
+        except (OSError, ValueError, KeyError):
+            pass
+
+        spans = self._scan()
+        if spans is not None:
+            try:
+                self._write_index(spans)
+            except OSError as e:
+                logger.debug(f"Could not write the index {self.index_filename}: {e}")
+        return spans
+
+    def _read_value(self, fd, key):
+        """Decode the value of the key from the open file."""
+        start, end = self._spans[key]
+        fd.seek(start)
+        return json.loads(fd.read(end - start))
+
+    def _scan(self):
+        """Find the location of each top-level value in the file.
+
+        Returns
+        -------
+        {str: (int, int)} or None
+            The start and end byte of each value, or None if the file is not
+            a JSON object.
+        """
+        spans = {}
+        with open(self.filename, "rb") as fd:
+            try:
+                buffer = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty file
+                return None
+            try:
+                depth = 0
+                expect_key = False
+                key = None
+                start = None
+                for match in _json_tokens.finditer(buffer):
+                    c = buffer[match.start()]
+                    if c == ord('"'):
+                        if depth == 0:
+                            return None
+                        if depth == 1 and expect_key:
+                            key = json.loads(match.group())
+                            expect_key = False
+                    elif c == ord("{") or c == ord("["):
+                        if depth == 0:
+                            if c == ord("["):
+                                return None
+                            expect_key = True
+                        depth += 1
+                    elif c == ord("}") or c == ord("]"):
+                        depth -= 1
+                        if depth == 0 and key is not None:
+                            spans[key] = (start, match.start())
+                    elif depth == 1:
+                        if c == ord(":"):
+                            start = match.end()
+                        else:
+                            spans[key] = (start, match.start())
+                            key = None
+                            expect_key = True
+            finally:
+                buffer.close()
+        return spans
+
+    def _write_index(self, spans):
+        """Save the location of the values next to the file."""
+        stat = os.stat(self.filename)
+        index = {"stamp": [stat.st_size, stat.st_mtime_ns], "spans": spans}
+        tmp = temporary_path(self.index_filename)
+        with open(tmp, "w") as fd:
+            json.dump(index, fd)
+        os.replace(tmp, self.index_filename)
+
+    def _replay(self):
+        """Apply the changes in the journal to the data.
+
+        A partial record at the end, left by a crash while writing, is ignored
+        and removed so that further records can be appended.
+        """
+        path = self.journal_filename
+        if not os.path.exists(path):
+            return
+
+        good = 0
+        with open(path, "rb") as fd:
+            for line in fd:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("incomplete record")
+                    record = json.loads(line)
+                except ValueError:
+                    logger.warning(
+                        f"Ignoring a partial record at the end of {path}, "
+                        "probably from a crash."
+                    )
+                    break
+                self._data.update(record.get("set", {}))
+                for key in record.get("delete", []):
+                    self._data.pop(key, None)
+                good += len(line)
+                self._n_records += 1
+        if good != os.path.getsize(path):
+            os.truncate(path, good)
+
+    def _write(self, data):
+        """Write the data to the file, replacing it atomically.
+
+        Keyword arguments:
+            data: a copy of the data to write
+        """
+        tmp = temporary_path(self.filename)
+        if not self._is_lazy():
+            with self._open("w", tmp) as fd:
+                json.dump(data, fd)
+            replace_file(tmp, self.filename)
+            return
+
+        # Write a value at a time, recording where they are. Values not yet
+        # read are copied from the old file without decoding.
+        spans = {}
+        source = None
+        try:
+            with open(tmp, "wb") as fd:
+                fd.write(b"{")
+                for key, value in data.items():
+                    if len(spans) > 0:
+                        fd.write(b", ")
+                    fd.write(json.dumps(key).encode() + b": ")
+                    if value is _UNLOADED:
+                        if source is None:
+                            source = open(self.filename, "rb")
+                        start, end = self._spans[key]
+                        source.seek(start)
+                        text = source.read(end - start)
+                    else:
+                        text = json.dumps(value).encode()
+                    start = fd.tell()
+                    fd.write(text)
+                    spans[key] = (start, start + len(text))
+                fd.write(b"}")
+        finally:
+            if source is not None:
+                source.close()
+        with self._lock:
+            replace_file(tmp, self.filename)
+            self._spans = spans
+        self._write_index(spans)
+
+    def _open(self, mode="r", filename=None):
+        """Open self.filename, using compression according to its extension,
+
+        Keyword arguments:
+            mode: "r" to read or "w" to write
+            filename: a different file to open with the same compression
+        """
+        if filename is None:
+            filename = self.filename
 
         extension = os.path.splitext(self.filename)[1].strip().lower()
         if extension == ".bz2":
-            fd = bz2.open(self.filename, "rt")
+            fd = bz2.open(filename, mode + "t")
         elif extension == ".gz":
-            fd = gzip.open(self.filename, "rt")
+            fd = gzip.open(filename, mode + "t")
         else:
-            fd = open(self.filename, "r")
+            fd = open(filename, mode)
 
         return fd
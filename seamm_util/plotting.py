@@ -19,11 +19,19 @@ The various containers in this package contain dictionaries of Jinja keys and
 the associated values. The keys needed are defined by the template used.
 """
 
+import base64
+import collections
+import concurrent.futures
 import logging
 import json
 from pathlib import Path
+import time
+import weakref
+
+import numpy as np
 
 from .dictionary import Dictionary
+from .write_behind import replace_file, temporary_path
 
 logger = logging.getLogger(__name__)
 
@@ -45,9 +53,259 @@ else:
     have_plotly = True
 
 
+def lttb(x, y, n):
+    """Select about n points using largest-triangle-three-buckets.
+
+    The first and last points are always kept, as are the smallest and
+    largest values of y, so at most n + 2 points are returned.
+
+    Parameters
+    ----------
+    x : array_like
+        The x values, which must be numeric.
+    y : array_like
+        The y values.
+    n : int
+        The target number of points, at least 3.
+
+    Returns
+    -------
+    numpy.ndarray
+        The sorted indices of the points to keep.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    size = y.size
+    if n < 3:
+        raise ValueError(f"LTTB needs at least 3 points, not {n}.")
+    if size <= n:
+        return np.arange(size)
+
+    # n - 2 buckets between the fixed first and last points
+    edges = np.linspace(1, size - 1, n - 1).astype(np.int64)
+    counts = np.diff(edges)
+    avg_x = np.add.reduceat(x[:-1], edges[:-1]) / counts
+    avg_y = np.add.reduceat(y[:-1], edges[:-1]) / counts
+    next_x = np.append(avg_x[1:], x[-1])
+    next_y = np.append(avg_y[1:], y[-1])
+
+    selected = np.empty(n, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = size - 1
+    a = 0
+    for i in range(n - 2):
+        lo = edges[i]
+        hi = edges[i + 1]
+        area = np.abs(
+            (x[a] - next_x[i]) * (y[lo:hi] - y[a])
+            - (x[a] - x[lo:hi]) * (next_y[i] - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        selected[i + 1] = a
+
+    return np.unique(np.concatenate((selected, [np.argmin(y), np.argmax(y)])))
+
+
+def min_max(y, n):
+    """Select about n points keeping the minimum and maximum of each bucket.
+
+    The points are split into n // 2 buckets of equal size, which for a plot
+    are roughly pixel columns. Keeping both extrema of each bucket draws the
+    same envelope as the full data.
+
+    Parameters
+    ----------
+    y : array_like
+        The y values.
+    n : int
+        The target number of points.
+
+    Returns
+    -------
+    numpy.ndarray
+        The sorted indices of the points to keep.
+    """
+    y = np.asarray(y)
+    size = y.size
+    if size <= n:
+        return np.arange(size)
+
+    nbuckets = max(n // 2, 1)
+    edges = np.linspace(0, size, nbuckets + 1).astype(np.int64)
+    starts = edges[:-1]
+    ends = edges[1:]
+    width = int((ends - starts).max())
+    # Pad short buckets by repeating their last point
+    index = np.minimum(starts[:, None] + np.arange(width), (ends - 1)[:, None])
+    values = y[index]
+    rows = np.arange(nbuckets)
+    lo = index[rows, values.argmin(axis=1)]
+    hi = index[rows, values.argmax(axis=1)]
+
+    return np.unique(np.concatenate(([0], lo, hi, [size - 1])))
+
+
+decimators = {"lttb": lttb, "minmax": min_max}
+
+file_types = ("graph", "html", "htm", "png", "jpeg", "jpg", "webp", "svg", "pdf")
+image_types = ("png", "jpeg", "jpg", "webp", "svg", "pdf")
+
+# Arrays shorter than this are written as plain lists
+min_typed_array = 64
+
+# Scatter traces with more points than this are drawn with WebGL by default
+webgl_threshold = 100000
+
+# Whether graph files use typed arrays by default. Plotly.js only reads them
+# from version 2.28, so plain lists are written for older Dashboards.
+graph_typed_arrays = False
+
+
+def typed_array(array):
+    """Encode a numeric array as a plotly typed array.
+
+    Plotly.js reads {"dtype": ..., "bdata": ...} objects, where bdata is the
+    base64-encoded little-endian binary data. Integers are narrowed to 32 bits
+    where possible since Plotly.js does not handle 64-bit integers.
+
+    Parameters
+    ----------
+    array : numpy.ndarray
+        The numeric array to encode.
+
+    Returns
+    -------
+    dict
+        The typed array specification.
+    """
+    if array.dtype.kind in "iu":
+        info = np.iinfo(np.int32)
+        if array.size == 0 or (array.min() >= info.min and array.max() <= info.max):
+            array = array.astype("<i4")
+        else:
+            array = array.astype("<f8")
+    elif array.dtype.kind == "f" and array.dtype.itemsize == 4:
+        array = array.astype("<f4")
+    else:
+        array = array.astype("<f8")
+
+    result = {
+        "dtype": array.dtype.str[1:],
+        "bdata": base64.b64encode(np.ascontiguousarray(array)).decode("ascii"),
+    }
+    if array.ndim > 1:
+        result["shape"] = ", ".join(str(n) for n in array.shape)
+    return result
+
+
+def _encode(array, typed_arrays):
+    """Encode an array for JSON, as a typed array or a list."""
+    if (
+        typed_arrays
+        and array.size >= min_typed_array
+        and np.issubdtype(array.dtype, np.number)
+    ):
+        return typed_array(array)
+    return array.tolist()
+
+
+def decode_typed_arrays(data):
+    """Replace any plotly typed arrays in the data with NumPy arrays.
+
+    Parameters
+    ----------
+    data : dict, list or other
+        The data, e.g. from json.loads of a graph.
+
+    Returns
+    -------
+    The data with the typed arrays decoded.
+    """
+    if isinstance(data, dict):
+        if "bdata" in data and "dtype" in data:
+            dtype = np.dtype("<" + data["dtype"].rstrip("c"))
+            array = np.frombuffer(base64.b64decode(data["bdata"]), dtype=dtype)
+            if "shape" in data:
+                array = array.reshape([int(n) for n in data["shape"].split(",")])
+            return array
+        return {key: decode_typed_arrays(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [decode_typed_arrays(value) for value in data]
+    return data
+
+
+# The compiled templates for each Jinja environment
+_templates = weakref.WeakKeyDictionary()
+
+
+def get_template(env, name):
+    """Return the compiled template, caching it for later use.
+
+    Unlike env.get_template, which checks whether the template file has
+    changed each time, this returns the cached template directly. The first
+    use of an environment also installs the jsonify filter if needed.
+
+    Parameters
+    ----------
+    env : jinja2.Environment
+        The Jinja environment.
+    name : str
+        The name of the template.
+
+    Returns
+    -------
+    jinja2.Template
+    """
+    templates = _templates.get(env)
+    if templates is None:
+        if "jsonify" not in env.filters:
+            env.filters["jsonify"] = json.dumps
+        templates = _templates[env] = {}
+    template = templates.get(name)
+    if template is None:
+        template = templates[name] = env.get_template(name)
+    return template
+
+
+def clear_template_cache():
+    """Clear the cache of compiled templates, e.g. after editing them."""
+    _templates.clear()
+
+
+def file_type(path, _type=None):
+    """The type of graph file, by default from the extension of the path.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        The file to write.
+    _type : str, optional
+        The type of file, with or without an initial '.'.
+
+    Returns
+    -------
+    str
+        The type, in lowercase.
+    """
+    if _type is None:
+        _type = Path(path).suffix
+
+    # Remove the initial dot if given as a suffix
+    if _type.startswith("."):
+        _type = _type[1:]
+
+    _type = _type.lower()
+    if _type not in file_types:
+        raise ValueError(f"write_graph does not support files of type '{_type}'")
+    return _type
+
+
 class Figure(Dictionary):
     """Holds one or more subplots and controls the layout."""
 
+    # Counts the changes to the dictionary, so update_file can see them
+    _generation = 0
+
     def __init__(self, *args, jinja_env=None, template=None, **kwargs):
         """Initialize a figure.
 
@@ -62,6 +320,25 @@ class Figure(Dictionary):
 
         self._grid = {"nrows": 0, "ncolumns": 0, "plots": {}, "layout": {}}
 
+        # The state of the files written by update_file
+        self._live = {}
+
+    def __setitem__(self, key, value):
+        """Allow x[key] access to the data, counting the change."""
+        super().__setitem__(key, value)
+        self._generation += 1
+
+    def __delitem__(self, key):
+        """Allow deletion of keys, counting the change."""
+        super().__delitem__(key)
+        self._generation += 1
+
+    def __getstate__(self):
+        """Pickle the figure without the Jinja environment, which can't be."""
+        state = self.__dict__.copy()
+        state["_jinja_env"] = None
+        return state
+
     @property
     def template(self):
         """The template to use for this figure."""
@@ -237,39 +514,252 @@ class Figure(Dictionary):
                         else:
                             break
 
-    def dump(self, filename):
+    def dump(self, filename, **kwargs):
         """Write the filled in template to disk as <filename>.
 
+        The document is streamed to the file as it is rendered.
+
         Parameters
         ----------
         filename : str or filepath
             The name or path to the file to write.
+        kwargs : keyword - value pairs
+            Options for dumps()
 
         Returns
         -------
         nothing
         """
-
-        text = self.dumps()
         with open(filename, "w") as fd:
-            fd.write(text)
+            if self.template is None:
+                json.dump(self.to_plotly_dict(**kwargs), fd)
+            else:
+                template = get_template(self._jinja_env, self.template)
+                template.stream(self._context(**kwargs)).dump(fd)
 
-    def dumps(self):
+    def dumps(
+        self,
+        max_points=None,
+        decimation="lttb",
+        typed_arrays=False,
+        webgl_threshold=webgl_threshold,
+    ):
         """Return the filled in template document as a string.
 
         Merge the layout data and the traces into the template document and
-        return a string version of the document.
+        return a string version of the document. If the figure has no
+        template, the JSON for the plotly figure is created directly.
+
+        Parameters
+        ----------
+        max_points : int, optional
+            Decimate traces with more than this many points. The default of
+            None keeps all the points. The setting on a trace, or else on its
+            plot, takes precedence.
+        decimation : str, optional
+            The decimation method, "lttb" (the default) or "minmax", again
+            unless set on the trace or plot.
+        typed_arrays : bool, optional
+            Write large numeric arrays in trace data as base64 typed arrays,
+            which Plotly.js 2.28 and later reads. The default of False writes
+            plain lists, which any version reads.
+        webgl_threshold : int, optional
+            Scatter traces with more points than this, after any decimation,
+            are drawn with WebGL as "scattergl", since SVG is too slow in the
+            browser for large traces. The webgl attribute of a trace
+            overrides this. None turns the promotion off. The template must
+            use the trace's type for this to have an effect.
 
         Returns
         -------
         str
             The resulting document.
         """
-        # Ensure that the jsonify filter is available in Jinja
+        options = {
+            "max_points": max_points,
+            "decimation": decimation,
+            "typed_arrays": typed_arrays,
+            "webgl_threshold": webgl_threshold,
+        }
+        if self.template is None:
+            return json.dumps(self.to_plotly_dict(**options))
+
+        template = get_template(self._jinja_env, self.template)
+        return template.render(self._context(**options))
+
+    def update_file(self, path, compact_every=100, typed_arrays=None, **kwargs):
+        """Write the figure or, if possible, just the new points to a file.
+
+        The first call writes the whole figure to 'path'. Later calls append
+        only the points added to the traces since then to '<path>.patch', one
+        JSON line per call, so the cost is proportional to the new points.
+        Each line holds one or more records like the arguments of plotly's
+        extendTraces::
+
+            [{"update": {"x": [[...], [...]], "y": [[...], [...]]},
+              "indices": [0, 2]}]
+
+        where the indices are the positions of the traces in the figure. A
+        reader loads the figure then applies the patches in order. Every
+        'compact_every' updates, or when traces are added or replaced, their
+        data is set rather than appended to, or the figure, axes or traces are
+        otherwise changed, the whole file is rewritten atomically and the
+        patch file removed.
+
+        Parameters
+        ----------
+        path : str or pathlib.Path
+            The file for the whole figure.
+        compact_every : int, default=100
+            The number of patches before the file is rewritten.
+        typed_arrays : bool, optional
+            Write the whole file with typed arrays, which need Plotly.js 2.28
+            or later. The default of None uses graph_typed_arrays. Patches
+            are always plain lists.
+        kwargs : keyword - value pairs
+            Options for dumps(). Any decimation applies only to the whole
+            file; patches contain every new point.
+
+        Returns
+        -------
+        bool
+            True if the whole file was written, False for a patch.
+        """
+        path = Path(path)
+        patch_path = path.with_name(path.name + ".patch")
+        traces = [trace for plot in self._ordered_plots() for trace in plot.values()]
+        ids = [id(trace) for trace in traces]
+        counts = [trace.n_points for trace in traces]
+        generations = self._generations(traces)
+
+        state = self._live.get(path)
+        if (
+            state is None
+            or state["ids"] != ids
+            or state["generations"] != generations
+            or state["patches"] >= compact_every
+            or any(new < old for old, new in zip(state["counts"], counts))
+            or not path.exists()
+        ):
+            if typed_arrays is None:
+                typed_arrays = graph_typed_arrays
+            tmp = temporary_path(path)
+            self.dump(tmp, typed_arrays=typed_arrays, **kwargs)
+            replace_file(tmp, path)
+            if patch_path.exists():
+                patch_path.unlink()
+            self._live[path] = {
+                "ids": ids,
+                "counts": counts,
+                "generations": generations,
+                "patches": 0,
+            }
+            return True
+
+        # Group the traces with new points by the arrays that are extended
+        groups = {}
+        for index, (trace, old, new) in enumerate(zip(traces, state["counts"], counts)):
+            if new == old:
+                continue
+            keys = tuple(
+                key
+                for key in trace.array_keys
+                if isinstance(trace.get(key), np.ndarray) and len(trace[key]) == new
+            )
+            group = groups.setdefault(keys, {"update": {}, "indices": []})
+            for key in keys:
+                group["update"].setdefault(key, []).append(trace[key][old:].tolist())
+            group["indices"].append(index)
+
+        if len(groups) > 0:
+            with open(patch_path, "a") as fd:
+                fd.write(json.dumps(list(groups.values())) + "\n")
+            state["counts"] = counts
+            state["patches"] += 1
+        return False
+
+    def to_plotly_dict(
+        self,
+        max_points=None,
+        decimation="lttb",
+        typed_arrays=None,
+        webgl_threshold=webgl_threshold,
+    ):
+        """Return the plotly figure as a dictionary, without a template.
+
+        The SEAMM keys color and dash become the line's color and dash, and
+        the labels and units are used for the hover text. Other keys of the
+        traces and axes are passed to plotly as they are.
 
-        if "jsonify" not in self._jinja_env.filters:
-            self._jinja_env.filters["jsonify"] = json.dumps
+        Parameters
+        ----------
+        max_points : int, optional
+            Decimate traces with more than this many points, as in dumps().
+        decimation : str, optional
+            The decimation method, as in dumps().
+        typed_arrays : bool, optional
+            True or False encodes the arrays for JSON, as in dumps(). The
+            default of None leaves NumPy arrays as they are.
+        webgl_threshold : int, optional
+            The number of points above which traces use WebGL, as in dumps().
 
+        Returns
+        -------
+        dict
+            The plotly figure, with "data" and "layout".
+        """
+        axes, traces = self._layout(
+            max_points=max_points,
+            decimation=decimation,
+            typed_arrays=typed_arrays,
+            encode=typed_arrays is not None,
+            webgl_threshold=webgl_threshold,
+        )
+
+        layout = {
+            "title": {"text": self.get("title", ""), "x": 0.5, "xanchor": "center"}
+        }
+        for axis in axes:
+            layout[axis["name"]] = _plotly_axis(axis)
+
+        return {"data": [_plotly_trace(trace) for trace in traces], "layout": layout}
+
+    def _context(self, **kwargs):
+        """The data for the template."""
+        axes, traces = self._layout(**kwargs)
+        tmp = dict(self)
+        tmp["traces"] = traces
+        tmp["axes"] = axes
+        return tmp
+
+    def _generations(self, traces):
+        """The change counts of the figure, its axes and the traces."""
+        result = [self._generation]
+        result.extend(
+            axis._generation for plot in self._plots.values() for axis in plot.axes
+        )
+        result.extend(trace._generation for trace in traces)
+        return result
+
+    def _ordered_plots(self):
+        """The plots in the order that their traces are written."""
+        if len(self._grid["layout"]) == 0:
+            return list(self._plots.values())
+        return self._grid["plots"]
+
+    def _layout(
+        self,
+        max_points=None,
+        decimation="lttb",
+        typed_arrays=False,
+        encode=True,
+        webgl_threshold=webgl_threshold,
+    ):
+        """Lay out the plots, returning the data for the axes and traces.
+
+        The axes are returned as their underlying dictionaries and the traces
+        as views of theirs, so no data is copied.
+        """
         # Get the layout (or create a default if there isn't one)
         # In the process get a list of the plots...
         plots = []
@@ -322,14 +812,15 @@ class Figure(Dictionary):
             plot.top = top
             plot.bottom = bottom
 
-        # Number the axes sequentially and set their limits
+        # Number the axes sequentially and set their limits. These are derived
+        # from the layout, so are not counted as changes to the axes.
         axis_number = {"x": 0, "y": 0, "z": 0}
         for plot in plots:
             for axis in plot.axes:
                 xyz = axis.direction
                 axis_number[xyz] += 1
                 anum = axis_number[xyz]
-                axis.update(
+                axis.data.update(
                     {
                         "number": axis_number[xyz],
                         "name": xyz + "axis" + ("" if anum == 1 else str(anum)),
@@ -340,47 +831,54 @@ class Figure(Dictionary):
                     length = plot.right - plot.left
                     left = plot.left + length * axis.start
                     right = plot.left + length * axis.stop
-                    axis.update({"start": left, "stop": right})
+                    axis.data.update({"start": left, "stop": right})
                 elif xyz == "y":
                     length = plot.top - plot.bottom
                     bottom = plot.bottom + length * axis.start
                     top = plot.bottom + length * axis.stop
-                    axis.update({"start": bottom, "stop": top})
+                    axis.data.update({"start": bottom, "stop": top})
 
         # Sort out any anchors between axes and get the data
         axes = []
         for plot in plots:
             for axis in plot.axes:
                 if axis.anchor is None:
-                    axis.update(anchor="free")
+                    axis.data.update(anchor="free")
                 else:
-                    axis.update(anchor=axis.anchor["short_name"])
-                axes.append(axis.to_dict())
+                    axis.data.update(anchor=axis.anchor["short_name"])
+                axes.append(axis.data)
 
         # And, finally, set up the traces
         traces = []
         for plot in plots:
             for trace in plot.values():
                 if trace.x_axis is not None:
-                    trace.update(xaxis=trace.x_axis["short_name"])
+                    trace.data.update(xaxis=trace.x_axis["short_name"])
                 if trace.y_axis is not None:
-                    trace.update(yaxis=trace.y_axis["short_name"])
+                    trace.data.update(yaxis=trace.y_axis["short_name"])
                 if trace.z_axis is not None:
-                    trace.update(zaxis=trace.z_axis["short_name"])
-
-                traces.append(trace.to_dict())
-
-        # Assemble all the data and pass to Jinja
-        tmp = dict(self)
-        tmp["traces"] = traces
-        tmp["axes"] = axes
-
-        template = self._jinja_env.get_template(self.template)
-        result = template.render(tmp)
+                    trace.data.update(zaxis=trace.z_axis["short_name"])
+
+                n = trace.max_points
+                if n is None:
+                    n = plot.max_points
+                if n is None:
+                    n = max_points
+                method = trace.decimation or plot.decimation or decimation
+
+                traces.append(
+                    trace.view(
+                        max_points=n,
+                        decimation=method,
+                        typed_arrays=typed_arrays,
+                        encode=encode,
+                        webgl_threshold=webgl_threshold,
+                    )
+                )
 
-        return result
+        return axes, traces
 
-    def write_file(self, path, _type=None, width=1024, height=1024):
+    def write_file(self, path, _type=None, width=1024, height=1024, typed_arrays=None):
         """Write the graph to a file given by the path.
 
         The type may be given explicitly but by default is taken from the extension of
@@ -397,6 +895,9 @@ class Figure(Dictionary):
             The width in pixels, if appropriate
         height : int, default=1024
             The width in pixels, if appropriate
+        typed_arrays : bool, optional
+            Write a graph file with typed arrays, which need Plotly.js 2.28 or
+            later. The default of None uses graph_typed_arrays.
 
         Returns
         -------
@@ -466,49 +967,405 @@ class Figure(Dictionary):
 
             graph-formats = pdf svg html webp png jpeg
 
-        """
-        if _type is None:
-            if isinstance(path, str):
-                path = Path(path)
-            _type = path.suffix
-
-        # Remove the initial dot if given as a suffix
-        if _type.startswith("."):
-            _type = _type[1:]
-
-        _type = _type.lower()
-        if _type not in (
-            "graph",
-            "html",
-            "htm",
-            "png",
-            "jpeg",
-            "jpg",
-            "webp",
-            "svg",
-            "pdf",
-        ):
-            raise ValueError(f"write_graph does not support files of type '{_type}'")
+        Each image written this way starts kaleido anew. To write several
+        formats or figures, use write_files() or an ImageExporter, which write
+        them all through one kaleido session:
 
-        text = self.dumps()
+        .. code-block:: python
+
+            write_files([(figure, [self.wd / "EnergyScan.graph", *extra_paths])])
+        """
+        path = Path(path)
+        _type = file_type(path, _type)
 
         if _type == "graph":
-            path.write_text(text)
+            if typed_arrays is None:
+                typed_arrays = graph_typed_arrays
+            path.write_text(self.dumps(typed_arrays=typed_arrays))
         else:
-            if not have_plotly:
-                raise RuntimeError(
-                    "To write graphs to e.g. PDF files, please install plotly and "
-                    "kaleido:\n"
-                    "     conda install -c conda-forge plotly\n"
-                    "     pip install -U kaleido"
+            fig = self.to_plotly()
+            if _type in ("html", "htm"):
+                plotly.io.write_html(fig, path)
+            else:
+                plotly.io.write_image(
+                    fig, path, format=_type, width=width, height=height
                 )
-            tmp = json.loads(text)
-            fig = plotly.graph_objects.Figure(tmp["data"], tmp["layout"])
 
+    def to_plotly(self, text=None):
+        """Create a plotly figure from this figure.
+
+        The template, if any, must produce the JSON for a plotly figure, as
+        the graph templates do.
+
+        Parameters
+        ----------
+        text : str, optional
+            The output of dumps(), if already available.
+
+        Returns
+        -------
+        plotly.graph_objects.Figure
+        """
+        if not have_plotly:
+            raise RuntimeError(
+                "To write graphs to e.g. PDF files, please install plotly and "
+                "kaleido:\n"
+                "     conda install -c conda-forge plotly\n"
+                "     pip install -U kaleido"
+            )
+        if text is None:
+            if self.template is None:
+                tmp = self.to_plotly_dict()
+            else:
+                tmp = decode_typed_arrays(json.loads(self.dumps()))
+        else:
+            tmp = decode_typed_arrays(json.loads(text))
+        return plotly.graph_objects.Figure(tmp["data"], tmp["layout"])
+
+
+class ImageExporter(object):
+    """Write many figures to many formats through one kaleido session.
+
+    Starting kaleido, and the browser behind it, takes far longer than drawing
+    a typical graph, so the images are gathered and written together when the
+    exporter is flushed or the context exits. Where kaleido offers a
+    persistent server, it is kept running for the life of the context. Each
+    figure is rendered and converted to a plotly figure only once, however
+    many formats are requested.
+
+    .. code-block:: python
+
+        with ImageExporter() as exporter:
+            for name, figure in figures.items():
+                exporter.add(figure, [wd / f"{name}.{ext}" for ext in formats])
+    """
+
+    def __init__(self, width=1024, height=1024):
+        """
+        Parameters
+        ----------
+        width : int, default=1024
+            The width in pixels of the images.
+        height : int, default=1024
+            The height in pixels of the images.
+        """
+        self.width = width
+        self.height = height
+        self._jobs = []
+        self._server = False
+
+    def __enter__(self):
+        if have_plotly:
+            kaleido = _kaleido()
+            if kaleido is not None and hasattr(kaleido, "start_sync_server"):
+                kaleido.start_sync_server()
+                self._server = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if exc_type is None:
+                self.flush()
+        finally:
+            if self._server:
+                _kaleido().stop_sync_server()
+                self._server = False
+
+    def add(self, figure, paths, text=None, typed_arrays=None):
+        """Write a figure to files, queueing any images.
+
+        Parameters
+        ----------
+        figure : Figure
+            The figure to write.
+        paths : [str or pathlib.Path]
+            The files to write, with the types given by the extensions.
+        text : str, optional
+            The output of figure.dumps(), if already available.
+        typed_arrays : bool, optional
+            Write graph files with typed arrays, which need Plotly.js 2.28 or
+            later. The default of None uses graph_typed_arrays. This is not
+            used if the text is given.
+        """
+        paths = [Path(path) for path in paths]
+        types = [file_type(path) for path in paths]
+        if text is None:
+            if typed_arrays is None:
+                typed_arrays = graph_typed_arrays
+            text = figure.dumps(typed_arrays=typed_arrays)
+
+        fig = None
+        for path, _type in zip(paths, types):
+            if _type == "graph":
+                path.write_text(text)
+                continue
+            if fig is None:
+                fig = figure.to_plotly(text)
+                fig_dict = fig.to_dict()
             if _type in ("html", "htm"):
                 plotly.io.write_html(fig, path)
             else:
-                plotly.io.write_image(fig, path, format=_type, width=1024, height=1024)
+                self._jobs.append((fig_dict, path, _type))
+
+    def flush(self):
+        """Write all the queued images."""
+        if len(self._jobs) == 0:
+            return
+        jobs = self._jobs
+        self._jobs = []
+
+        figs = [job[0] for job in jobs]
+        paths = [job[1] for job in jobs]
+        formats = [job[2] for job in jobs]
+        if hasattr(plotly.io, "write_images"):
+            plotly.io.write_images(
+                figs,
+                paths,
+                format=formats,
+                width=self.width,
+                height=self.height,
+                validate=False,
+            )
+        else:
+            # Older plotly keeps a single kaleido process itself
+            for fig, path, _type in jobs:
+                plotly.io.write_image(
+                    fig,
+                    path,
+                    format=_type,
+                    width=self.width,
+                    height=self.height,
+                    validate=False,
+                )
+
+
+def write_files(jobs, width=1024, height=1024, typed_arrays=None):
+    """Write several figures, each to one or more files.
+
+    Parameters
+    ----------
+    jobs : iterable of (Figure, [str or pathlib.Path])
+        The figures and the files to write for each.
+    width : int, default=1024
+        The width in pixels of any images.
+    height : int, default=1024
+        The height in pixels of any images.
+    typed_arrays : bool, optional
+        Write graph files with typed arrays, which need Plotly.js 2.28 or
+        later. The default of None uses graph_typed_arrays.
+    """
+    with ImageExporter(width=width, height=height) as exporter:
+        for figure, paths in jobs:
+            exporter.add(figure, paths, typed_arrays=typed_arrays)
+
+
+def render_many(
+    figures,
+    formats=("graph",),
+    max_workers=None,
+    width=1024,
+    height=1024,
+    typed_arrays=None,
+):
+    """Render and write many figures in parallel using a pool of processes.
+
+    Each figure is rendered with its own Jinja environment and template, then
+    written to each of the formats. Jinja environments cannot be pickled, so
+    each worker process rebuilds every distinct environment once from its
+    loader, options, filters and globals, which must therefore be picklable.
+
+    Parameters
+    ----------
+    figures : {str or pathlib.Path: Figure}
+        The figures keyed by the path to write, without the extension. A
+        sequence of (path, figure) pairs is also accepted.
+    formats : [str], default=("graph",)
+        The file types to write, e.g. "graph", "html", "png" or "pdf".
+    max_workers : int, optional
+        The number of processes. The default is the number of CPUs. With one
+        worker, or a single figure, the work is done in this process.
+    width : int, default=1024
+        The width in pixels of any images.
+    height : int, default=1024
+        The height in pixels of any images.
+    typed_arrays : bool, optional
+        Write graph files with typed arrays, which need Plotly.js 2.28 or
+        later. The default of None uses graph_typed_arrays.
+
+    Returns
+    -------
+    {str or pathlib.Path: dict}
+        For each figure, the time in seconds for "render" and "export" and
+        the "total" in the worker, keyed as the figures were.
+    """
+    if typed_arrays is None:
+        typed_arrays = graph_typed_arrays
+    if isinstance(figures, dict):
+        figures = figures.items()
+    jobs = []
+    for stem, figure in figures:
+        paths = [Path(f"{stem}.{_format.lstrip('.')}") for _format in formats]
+        jobs.append((stem, figure, paths))
+
+    timings = {}
+    if max_workers == 1 or len(jobs) < 2:
+        for stem, figure, paths in jobs:
+            timings[stem] = _render_figure(figure, paths, width, height, typed_arrays)
+        return timings
+
+    # Send the specifications of the distinct Jinja environments to the workers.
+    # Figures without a template have no environment.
+    specs = []
+    env_index = {id(None): None}
+    for stem, figure, paths in jobs:
+        env = figure._jinja_env
+        if id(env) not in env_index:
+            env_index[id(env)] = len(specs)
+            specs.append(_environment_spec(env))
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_worker, initargs=(specs,)
+    ) as pool:
+        futures = {
+            stem: pool.submit(
+                _render_job,
+                env_index[id(figure._jinja_env)],
+                figure,
+                paths,
+                width,
+                height,
+                typed_arrays,
+            )
+            for stem, figure, paths in jobs
+        }
+        for stem, future in futures.items():
+            timings[stem] = future.result()
+            logger.debug(f"Rendered {stem}: {timings[stem]}")
+    return timings
+
+
+# The Jinja environments in a worker process of render_many
+_worker_environments = []
+
+
+def _environment_spec(env):
+    """The picklable parts of a Jinja environment needed to recreate it."""
+    import jinja2.defaults
+
+    options = {
+        name: getattr(env, name)
+        for name in (
+            "block_start_string",
+            "block_end_string",
+            "variable_start_string",
+            "variable_end_string",
+            "comment_start_string",
+            "comment_end_string",
+            "line_statement_prefix",
+            "line_comment_prefix",
+            "trim_blocks",
+            "lstrip_blocks",
+            "newline_sequence",
+            "keep_trailing_newline",
+            "optimized",
+            "undefined",
+            "finalize",
+            "autoescape",
+            "loader",
+        )
+    }
+    options["extensions"] = [type(ext) for ext in env.extensions.values()]
+    filters = {
+        key: value
+        for key, value in env.filters.items()
+        if jinja2.defaults.DEFAULT_FILTERS.get(key) is not value
+    }
+    _globals = {
+        key: value
+        for key, value in env.globals.items()
+        if jinja2.defaults.DEFAULT_NAMESPACE.get(key) is not value
+    }
+    return options, filters, _globals
+
+
+def _init_worker(specs):
+    """Create the Jinja environments in a worker process of render_many."""
+    import jinja2
+
+    for options, filters, _globals in specs:
+        env = jinja2.Environment(**options)
+        env.filters.update(filters)
+        env.globals.update(_globals)
+        _worker_environments.append(env)
+
+
+def _render_job(env_index, figure, paths, width, height, typed_arrays):
+    """Render and write one figure in a worker process of render_many."""
+    if env_index is not None:
+        figure._jinja_env = _worker_environments[env_index]
+    return _render_figure(figure, paths, width, height, typed_arrays)
+
+
+def _render_figure(figure, paths, width, height, typed_arrays):
+    """Render a figure and write it to the paths, returning the timings."""
+    t0 = time.perf_counter()
+    text = figure.dumps(typed_arrays=typed_arrays)
+    t1 = time.perf_counter()
+    with ImageExporter(width=width, height=height) as exporter:
+        exporter.add(figure, paths, text=text)
+    t2 = time.perf_counter()
+    return {"render": t1 - t0, "export": t2 - t1, "total": t2 - t0}
+
+
+# Keys of SEAMM traces and axes used by the templates rather than by plotly
+_trace_keys = ("color", "dash", "xlabel", "xunits", "ylabel", "yunits")
+_axis_keys = ("number", "name", "short_name", "label", "start", "stop")
+
+
+def _plotly_trace(trace):
+    """Convert the data for a trace into a plotly trace."""
+    result = {"type": "scatter", "mode": "lines"}
+    explicit_x = "x" in trace
+    for key, value in trace.items():
+        if key in _trace_keys or (explicit_x and key in ("x0", "dx")):
+            continue
+        if key == "showlegend" and isinstance(value, str):
+            value = value.lower() == "true"
+        result[key] = value
+
+    line = {key: trace[key] for key in ("color", "dash") if key in trace}
+    if len(line) > 0:
+        line.update(result.get("line", {}))
+        result["line"] = line
+
+    if "xlabel" in trace or "ylabel" in trace:
+        result.setdefault(
+            "hovertemplate",
+            f"{trace.get('xlabel', 'x')}=%{{x}} {trace.get('xunits', '')}<br>"
+            f"{trace.get('ylabel', 'y')}=%{{y}} {trace.get('yunits', '')}",
+        )
+    return result
+
+
+def _plotly_axis(axis):
+    """Convert the data for an axis into a plotly axis."""
+    result = {
+        key: value
+        for key, value in axis.items()
+        if key not in _axis_keys and value is not None
+    }
+    result["domain"] = [axis["start"], axis["stop"]]
+    result["title"] = {"text": axis.get("label", "")}
+    return result
+
+
+def _kaleido():
+    """The kaleido module, or None if it is not installed."""
+    try:
+        import kaleido
+    except ImportError:
+        return None
+    return kaleido
 
 
 class Plot(Dictionary):
@@ -529,10 +1386,16 @@ class Plot(Dictionary):
         column=0,
         column_span=1,
         row_span=1,
+        max_points=None,
+        decimation=None,
     ):
         """Initialize a plot, optionally with data.
 
         Keyword arguments:
+        max_points : int, optional
+            Decimate traces in this plot that have more points than this.
+        decimation : str, optional
+            The decimation method for the traces, "lttb" or "minmax".
         """
         super().__init__(ordered=True)
 
@@ -544,6 +1407,8 @@ class Plot(Dictionary):
         self.column = column
         self.column_span = column_span
         self.row_span = row_span
+        self.max_points = max_points
+        self.decimation = decimation
 
         self._axes = []
 
@@ -599,6 +1464,9 @@ class Axis(Dictionary):
     for the axis.
     """
 
+    # Counts the changes to the dictionary, so update_file can see them
+    _generation = 0
+
     def __init__(self, direction, *args, anchor=None, start=0.0, stop=1.0, **kwargs):
         """Initialize an axis, optionally with data.
 
@@ -624,6 +1492,16 @@ class Axis(Dictionary):
 
         self.update(*args, **kwargs)
 
+    def __setitem__(self, key, value):
+        """Allow x[key] access to the data, counting the change."""
+        super().__setitem__(key, value)
+        self._generation += 1
+
+    def __delitem__(self, key):
+        """Allow deletion of keys, counting the change."""
+        super().__delitem__(key)
+        self._generation += 1
+
     def to_dict(self):
         """Return a dictionary representing the axis.
 
@@ -641,12 +1519,37 @@ class Trace(Dictionary):
     The Trace class contains the datasets and associated graphical
     control for how to display them. The class is a dict-like object
     where the elements of the dictionary are the traces.
+
+    Numeric data for the keys in array_keys is stored as NumPy arrays.
     """
 
-    def __init__(self, x_axis=None, y_axis=None, z_axis=None, **kwargs):
+    array_keys = ("x", "y", "z")
+
+    # Counts the changes to the dictionary other than appending points, so
+    # update_file can see them
+    _generation = 0
+
+    def __init__(
+        self,
+        x_axis=None,
+        y_axis=None,
+        z_axis=None,
+        max_points=None,
+        decimation=None,
+        webgl=None,
+        **kwargs,
+    ):
         """Initialize a trace, optionally with data.
 
         Keyword arguments:
+        max_points : int, optional
+            Decimate the trace when written if it has more points than this.
+        decimation : str, optional
+            The decimation method, "lttb" or "minmax".
+        webgl : bool, optional
+            Whether to draw a scatter trace with WebGL. The default of None
+            uses WebGL for traces with more points than the threshold given
+            to Figure.dumps().
         args : dict
             0+ dictionaries to update from, in order
         kwargs : keyword - value pairs
@@ -657,13 +1560,175 @@ class Trace(Dictionary):
         self.x_axis = x_axis
         self.y_axis = y_axis
         self.z_axis = z_axis
+        self.max_points = max_points
+        self.decimation = decimation
+        self.webgl = webgl
 
-    def to_dict(self):
+        # Storage for the arrays that are appended to, with room to grow
+        self._buffers = {}
+
+    @property
+    def n_points(self):
+        """The number of points in the trace."""
+        y = self.data.get("y")
+        return 0 if y is None else len(y)
+
+    def __setitem__(self, key, value):
+        """Allow x[key] access to the data, storing numeric data as arrays."""
+        if key in self.array_keys and isinstance(value, (list, tuple)):
+            array = np.asarray(value)
+            if np.issubdtype(array.dtype, np.number):
+                value = array
+        super().__setitem__(key, value)
+        self._generation += 1
+
+    def __delitem__(self, key):
+        """Allow deletion of keys, counting the change."""
+        super().__delitem__(key)
+        self._generation += 1
+
+    def append(self, **points):
+        """Append one or more points to the data of the trace.
+
+        The arrays are kept in buffers with spare room, so appending costs
+        time proportional to the new points rather than all of them.
+
+        .. code-block:: python
+
+            trace.append(x=t, y=energy)
+            trace.append(x=[t1, t2], y=[e1, e2])
+
+        Parameters
+        ----------
+        points : keyword - value pairs
+            The new values for each array, e.g. x and y, as single numbers or
+            sequences. For a trace with x0 and dx, give only y.
+        """
+        for key, values in points.items():
+            values = np.atleast_1d(np.asarray(values))
+            old = self.data.get(key)
+            if old is not None:
+                old = np.asarray(old)
+            n = 0 if old is None else len(old)
+            size = n + values.size
+            dtype = values.dtype if old is None else np.result_type(old, values)
+
+            buffer = self._buffers.get(key)
+            if (
+                buffer is None
+                or buffer.size < size
+                or buffer.dtype != dtype
+                or old is None
+                or old.base is not buffer
+            ):
+                buffer = np.empty(max(2 * size, 16), dtype=dtype)
+                if n > 0:
+                    buffer[:n] = old
+                self._buffers[key] = buffer
+            buffer[n:size] = values
+            self.data[key] = buffer[:size]
+
+    def to_dict(self, max_points=None, decimation="lttb", typed_arrays=False):
         """Return a dictionary representing the trace.
 
+        Parameters
+        ----------
+        max_points : int, optional
+            If the trace has more points than this, return only about this
+            many, chosen to preserve the shape and extrema of the data. Only x
+            and y are decimated; an implicit x from x0 and dx is made
+            explicit.
+        decimation : str, optional
+            The decimation method, "lttb" (the default) or "minmax".
+        typed_arrays : bool, optional
+            Return arrays of at least min_typed_array numbers as plotly typed
+            arrays rather than lists.
+
         Returns
         -------
         dict
             A dictionary of the trace data, suitable for Jinja.
         """
-        return dict(self.data)
+        result = dict(
+            self.view(
+                max_points=max_points, decimation=decimation, typed_arrays=typed_arrays
+            )
+        )
+        if "x" in result and "x" not in self.data:
+            result.pop("x0", None)
+            result.pop("dx", None)
+        return result
+
+    def view(
+        self,
+        max_points=None,
+        decimation="lttb",
+        typed_arrays=False,
+        encode=True,
+        webgl_threshold=None,
+    ):
+        """Return a read-only view of the trace data, for rendering.
+
+        Only the decimated or encoded arrays are new; the rest of the data is
+        not copied. The arguments are as for to_dict().
+
+        Parameters
+        ----------
+        encode : bool, optional
+            Whether to encode NumPy arrays for JSON. If False they are left as
+            they are.
+        webgl_threshold : int, optional
+            If given, a scatter trace with more points than this is changed
+            to "scattergl", unless the webgl attribute of the trace says
+            otherwise.
+
+        Returns
+        -------
+        collections.ChainMap
+            The changed arrays in front of the trace's data.
+        """
+        overrides = {}
+        if max_points is not None and "y" in self.data:
+            self._decimate(overrides, max_points, decimation)
+
+        if self.get("type", "scatter") == "scatter":
+            webgl = self.webgl
+            if webgl is None and webgl_threshold is not None:
+                n = len(overrides["y"]) if "y" in overrides else self.n_points
+                webgl = n > webgl_threshold
+            if webgl:
+                overrides["type"] = "scattergl"
+
+        if encode:
+            for key, value in self.data.items():
+                value = overrides.get(key, value)
+                if isinstance(value, np.ndarray):
+                    overrides[key] = _encode(value, typed_arrays)
+            if "x" in overrides and "x" not in self.data:
+                overrides["x"] = _encode(np.asarray(overrides["x"]), typed_arrays)
+
+        return collections.ChainMap(overrides, self.data)
+
+    def _decimate(self, result, max_points, decimation):
+        """Put the decimated x and y data into the dictionary."""
+        data = self.data
+        y = np.asarray(data["y"])
+        if y.ndim != 1 or y.size <= max_points:
+            return
+
+        if decimation not in decimators:
+            raise ValueError(f"Unknown decimation method '{decimation}'.")
+
+        if "x" in data:
+            x = np.asarray(data["x"])
+        else:
+            x = data.get("x0", 0) + data.get("dx", 1) * np.arange(y.size)
+
+        if decimation == "lttb":
+            # Categorical or date axes are treated as evenly spaced
+            xs = x if np.issubdtype(x.dtype, np.number) else np.arange(y.size)
+            keep = lttb(xs, y, max_points)
+        else:
+            keep = min_max(y, max_points)
+        result["x"] = x[keep]
+        result["y"] = y[keep]
@@ -16,19 +16,26 @@ By default, JOB level output is mirrored in the main log for the job
 as well as the local log for the stage. All output from the cutoff level
 up, which is NORMAL by default, is placed in the local stage log. Optionally,
 output from a cutoff level and up is also written to the standard output.
+
+Printing can optionally be queued, so that printing calls return immediately
+and a background thread writes the output. Use basicConfig(queued=True) or
+fileConfig(fname, queued=True), and call shutdown() to write everything queued
+before exiting.
 """
 
+import atexit
 import inspect
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 import textwrap
 
 try:
-    import thread
     import threading
 except ImportError:
-    thread = None
+    threading = None
 
 # ---------------------------------------------------------------------------
 #   Level related stuff
@@ -110,7 +117,7 @@ def _acquireLock():
     This should be released with _releaseLock().
     """
     global _lock
-    if (not _lock) and thread:
+    if (not _lock) and threading:
         _lock = threading.RLock()
     if _lock:
         _lock.acquire()
@@ -412,15 +419,16 @@ class Printer(logging.Filterer):
 
     def addHandler(self, hdlr):
         """
-        Add the specified handler to this printer.
+        Add the specified handler to this printer. If printing is queued, the
+        handler is fed from the queue by the background thread.
         """
-        self.logger.addHandler(hdlr)
+        self.logger.addHandler(_queued_handler(hdlr))
 
     def removeHandler(self, hdlr):
         """
         Remove the specified handler from this printer.
         """
-        self.logger.removeHandler(hdlr)
+        self.logger.removeHandler(_queued.get(hdlr, hdlr))
 
     def callHandlers(self, record):
         """
@@ -477,12 +485,17 @@ Printer.manager = Manager(Printer.print_root)
 BASIC_FORMAT = "{message:s}"
 
 
-def basicConfig():
+def basicConfig(queued=False):
     """
     Do basic configuration for the printing system by creating a
     StreamHandler with a default Formatter and adding it to the
     root logger.
+
+    If queued is True, printing calls only put the output on a queue, and a
+    background thread writes it.
     """
+    if queued:
+        _start_queue()
     if len(print_root.handlers) == 0:
         hdlr = logging.StreamHandler()
         fmt = logging.Formatter(BASIC_FORMAT, style="{")
@@ -490,10 +503,101 @@ def basicConfig():
         print_root.addHandler(hdlr)
 
 
+# ---------------------------------------------------------------------------
+# Queued printing
+# ---------------------------------------------------------------------------
+
+_queue = None
+_listener = None
+_queued = {}  # the queue handler standing in for each real handler
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """Put records on the printing queue for a single real handler."""
+
+    def __init__(self, queue, target):
+        super().__init__(queue)
+        self.target = target
+        self.setLevel(target.level)
+
+    def enqueue(self, record):
+        self.queue.put_nowait((self.target, record))
+
+
+class _QueueListener(logging.handlers.QueueListener):
+    """Pass the records on the printing queue to their handlers."""
+
+    def handle(self, item):
+        target, record = item
+        if record.levelno >= target.level:
+            target.handle(record)
+
+
+def _queued_handler(hdlr):
+    """The handler to add to a logger for hdlr, which is queued if needed."""
+    if _queue is None or isinstance(hdlr, _QueueHandler):
+        return hdlr
+    if hdlr not in _queued:
+        _queued[hdlr] = _QueueHandler(_queue, hdlr)
+    return _queued[hdlr]
+
+
+def _printers():
+    """All the printers, including the root printer."""
+    printers = [print_root]
+    for printer in Printer.manager.printerDict.values():
+        if isinstance(printer, Printer):
+            printers.append(printer)
+    return printers
+
+
+def _start_queue():
+    """Start queueing printing, moving any existing handlers to the queue."""
+    global _queue, _listener
+    _acquireLock()
+    try:
+        if _queue is not None:
+            return
+        _queue = queue.SimpleQueue()
+        _listener = _QueueListener(_queue)
+        _listener.start()
+        for printer in _printers():
+            for hdlr in list(printer.logger.handlers):
+                printer.logger.removeHandler(hdlr)
+                printer.logger.addHandler(_queued_handler(hdlr))
+    finally:
+        _releaseLock()
+
+
+def _stop_queue():
+    """Write all the queued output and go back to printing directly."""
+    global _queue, _listener
+    _acquireLock()
+    try:
+        if _queue is None:
+            return
+        _listener.stop()
+        for printer in _printers():
+            for hdlr in list(printer.logger.handlers):
+                if isinstance(hdlr, _QueueHandler):
+                    printer.logger.removeHandler(hdlr)
+                    printer.logger.addHandler(hdlr.target)
+        for hdlr in _queued:
+            hdlr.flush()
+        _queued.clear()
+        _queue = None
+        _listener = None
+    finally:
+        _releaseLock()
+
+
+atexit.register(_stop_queue)
+
+
 _handlers = {}  # repository of handlers (for flushing when shutdown called)
 
 
-def fileConfig(fname):
+def fileConfig(fname, queued=False):
     """
     Read the printing configuration from a ConfigParser-format file. This can
     be called several times from an application, allowing an end user the
@@ -504,12 +608,15 @@ def fileConfig(fname):
     shipped in 2.x versions of Python], you can pass in a file-like object
     rather than a filename, in which case the file-like object will be read
     using readfp.
+
+    If queued is True, printing calls only put the output on a queue, and a
+    background thread writes it to the handlers.
     """
-    import ConfigParser
+    import configparser
 
-    cp = ConfigParser.ConfigParser()
-    if hasattr(cp, "readfp") and hasattr(fname, "read"):
-        cp.readfp(fname)
+    cp = configparser.ConfigParser()
+    if hasattr(fname, "read"):
+        cp.read_file(fname)
     else:
         cp.read(fname)
     # first, do the formatters...
@@ -521,11 +628,11 @@ def fileConfig(fname):
             sectname = "formatter_%s" % form
             opts = cp.options(sectname)
             if "format" in opts:
-                fs = cp.get(sectname, "format", 1)
+                fs = cp.get(sectname, "format", raw=True)
             else:
                 fs = None
             if "datefmt" in opts:
-                dfs = cp.get(sectname, "datefmt", 1)
+                dfs = cp.get(sectname, "datefmt", raw=True)
             else:
                 dfs = None
             f = logging.Formatter(fs, dfs)
@@ -554,7 +661,7 @@ def fileConfig(fname):
                     klass = eval(klass)
                     args = cp.get(sectname, "args")
                     args = eval(args)
-                    h = klass(args)
+                    h = klass(*args)
                     if "level" in opts:
                         lvl = cp.get(sectname, "level")
                         h.setLevel(_levelNames[lvl])
@@ -574,7 +681,7 @@ def fileConfig(fname):
                                 if bc > 0:
                                     backcount = bc
                             h.setRollover(maxsize, backcount)
-                    elif klass == logging.MemoryHandler:
+                    elif klass == logging.handlers.MemoryHandler:
                         if "target" in opts:
                             target = cp.get(sectname, "target")
                         else:
@@ -598,7 +705,7 @@ def fileConfig(fname):
             if "level" in opts:
                 lvl = cp.get(sectname, "level")
                 log.setLevel(_levelNames[lvl])
-            for h in print_root.handlers:
+            for h in list(print_root.handlers):
                 print_root.removeHandler(h)
             hlist = cp.get(sectname, "handlers")
             if len(hlist):
@@ -615,7 +722,7 @@ def fileConfig(fname):
             # which were in the previous configuration but
             # which are not in the new configuration.
 
-            existing = print_root.manager.printDict.keys()
+            existing = list(print_root.manager.printerDict.keys())
 
             # now set up the new ones...
             for log in llist:
@@ -632,7 +739,7 @@ def fileConfig(fname):
                 if "level" in opts:
                     lvl = cp.get(sectname, "level")
                     printer.setLevel(_levelNames[lvl])
-                for h in printer.handlers:
+                for h in list(printer.handlers):
                     printer.removeHandler(h)
                 printer.propagate = propagate
                 printer.disabled = 0
@@ -656,6 +763,9 @@ def fileConfig(fname):
     finally:
         _releaseLock()
 
+    if queued:
+        _start_queue()
+
 
 # ---------------------------------------------------------------------------
 # Utility functions at module level.
@@ -730,7 +840,10 @@ def shutdown():
     """
     Perform any cleanup actions in the printing system (e.g. flushing
     buffers). Should be called at application exit.
+
+    Any queued output is written first, and printing is no longer queued.
     """
+    _stop_queue()
     for h in _handlers.keys():
         h.flush()
         h.close()
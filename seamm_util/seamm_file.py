@@ -6,15 +6,151 @@ using JSON to serialize and deserialize the data.
 
 It presents the dict api with the addition of methods to serialize and
 deserialize the contents.
+
+Files opened for writing are written to a temporary file which replaces the
+file atomically when it is closed. With write-behind, the text is collected in
+memory and written by a background thread, so that only the last of several
+rewrites within a short window reaches the disk.
+
+Numeric tables can be stored in a ColumnarFile, which has the same header
+line followed by a binary body of typed columns.
+
+The header of a file can be read cheaply with sniff_header(), which reads just
+the first block of the file, and scan_directory() does this for many files in
+parallel. Readers for the file types can be registered with
+register_filetype().
 """
 
 import bz2
+import concurrent.futures
 import gzip
+import io
+import json
 import logging
+import os
 import os.path
+from pathlib import Path
+import struct
+import threading
+import zlib
+
+import numpy as np
+
+from .write_behind import replace_file, temporary_path, WriteBehind
 
 logger = logging.getLogger(__name__)
 
+# The readers for file types, keyed by (organization, filetype)
+_filetypes = {}
+
+# The signatures of compressed files
+_magic = {b"\x1f\x8b": "gzip", b"BZh": "bzip2"}
+
+
+def register_filetype(organization, filetype, reader):
+    """Register the reader for a type of SEAMM file.
+
+    Parameters
+    ----------
+    organization : str
+        The organization that defined the file type.
+    filetype : str
+        The type of file, as given in the header.
+    reader : object
+        The class or function that reads this type of file.
+    """
+    _filetypes[(organization, filetype)] = reader
+
+
+def lookup_filetype(organization, filetype):
+    """The registered reader for a type of SEAMM file, or None."""
+    return _filetypes.get((organization, filetype))
+
+
+def sniff_header(path, blocksize=4096):
+    """Read the header of a SEAMM file without reading the rest of it.
+
+    The compression is found from the first bytes of the file, not the
+    extension, and only the first block is read and, if needed, decompressed.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        The file.
+    blocksize : int (optional)
+        The number of bytes to read. Defaults to 4096.
+
+    Returns
+    -------
+    (str, str, str, str) or None
+        The organization, filetype, version and compression ("text", "gzip" or
+        "bzip2"), or None if the file does not start with a header line.
+    """
+    with open(path, "rb") as fd:
+        block = fd.read(blocksize)
+    compression = "text"
+    for magic, name in _magic.items():
+        if block.startswith(magic):
+            compression = name
+            opener = gzip.open if name == "gzip" else bz2.open
+            try:
+                with opener(path, "rb") as fd:
+                    block = fd.read(blocksize)
+            except (OSError, EOFError):
+                return None
+            break
+
+    line = block.split(b"\n", 1)[0]
+    if line[0:1] != b"!":
+        return None
+    try:
+        words = line[1:].decode().split()
+    except UnicodeDecodeError:
+        return None
+    if len(words) != 3:
+        return None
+    return (*words, compression)
+
+
+def scan_directory(path, pattern="*", recursive=False, max_workers=None):
+    """Read the headers of the SEAMM files in a directory in parallel.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        The directory.
+    pattern : str (optional)
+        The glob pattern for the files. Defaults to all files.
+    recursive : bool (optional)
+        Whether to look in subdirectories as well. Defaults to False.
+    max_workers : int (optional)
+        The number of threads. Defaults to the ThreadPoolExecutor default.
+
+    Returns
+    -------
+    {pathlib.Path: (str, str, str, str)}
+        The organization, filetype, version and compression of each file that
+        has a header.
+    """
+    path = Path(path)
+    files = path.rglob(pattern) if recursive else path.glob(pattern)
+    files = [p for p in files if p.is_file()]
+
+    result = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for p, header in zip(files, pool.map(_sniff, files)):
+            if header is not None:
+                result[p] = header
+    return result
+
+
+def _sniff(path):
+    """Sniff the header of a file, ignoring files that cannot be read."""
+    try:
+        return sniff_header(path)
+    except OSError:
+        return None
+
 
 class File:
     def __init__(
@@ -25,9 +161,59 @@ class File:
         organization="MolSSI",
         filetype=None,
         version=None,
+        write_behind=None,
     ):
+        """A SEAMM file, with an optional header, and compression.
+
+        Parameters
+        ----------
+        filename : str or pathlib.Path
+            The path to the file.
+        mode : str
+            "r", "w" or "a" to read, write or append.
+        compression : str (optional)
+            "text", "bzip2", or "gzip". Defaults to using the file extension.
+        organization : str (optional)
+            The organization that defined the file type. Defaults to "MolSSI".
+        filetype : str (optional)
+            The type of file, needed for writing.
+        version : str (optional)
+            The version of the file type, needed for writing.
+        write_behind : float (optional)
+            The time in seconds to gather rewrites of the file before writing
+            it in a background thread. Defaults to None, writing directly.
+        """
         self.filename = filename
         self.mode = mode
+        self._tmp = None
+        self._text = None
+        self._lock = threading.Lock()
+        if write_behind is None or mode != "w":
+            self._writer = None
+        else:
+            self._writer = WriteBehind(
+                self._write_text, window=write_behind, name="File write-behind"
+            )
+
+        # Determine the type of the file
+        if compression is not None:
+            if compression == "bz2":
+                compression = "bzip2"
+            if compression not in ("text", "bzip2", "gzip"):
+                raise ValueError("Invalid compression: '{}'".format(compression))
+        else:
+            extension = os.path.splitext(self.filename)[1].strip().lower()
+            if extension == ".bz2":
+                compression = "bzip2"
+            elif extension == ".gz":
+                compression = "gzip"
+            else:
+                compression = "text"
+        self.compression = compression
+
+        self.organization = organization
+        self.filetype = filetype
+        self.version = version
 
         # Depending on the mode, may require filetype and version
         if self.mode == "w":
@@ -38,76 +224,382 @@ class File:
         elif self.mode == "a":
             if os.path.isfile(self.filename):
                 # Get the header and decipher
-                fd = self.__enter__()
-                try:
-                    line = next(fd)
-                except:  # noqa: E722
-                    raise RuntimeError("problem reading header line!")
-
-                fd.close()
-
-                # if line[0] == '!' and len(line.split()) == 3:
-                #     organization, filetype, version = line[1:].split()
+                self.read_header()
             else:
-                logger.warning(
-                    "reading '{}', expected a header line but got\n\t'{}'".format(
-                        self.filename, line
-                    )
-                )
-
                 if filetype is None:
                     raise ValueError("Filetype must be given to create a file!")
                 if version is None:
                     raise ValueError("Version must be given to create file!")
 
-        # Determine the type of the file
-        if compression is not None:
-            if compression not in ("text", "bz2", "gzip"):
-                raise ValueError("Invalid compression: '{}'".format(compression))
-        else:
-            extension = os.path.splitext(self.filename)[1].strip().lower()
-            if extension == ".bz2":
-                compression = "bzip2"
-            elif extension == ".gz":
-                compression = "gzip"
-            else:
-                compression = "text"
-        self.compression = compression
-
     def __enter__(self):
-        if self.compression == "bzip2":
-            self.file_descriptor = bz2.open(self.filename, self.mode + "t")
-        elif self.compression == "gzip":
-            self.file_descriptor = gzip.open(self.filename, self.mode + "t")
+        if self._writer is not None:
+            self.file_descriptor = io.StringIO()
+        elif self.mode == "w":
+            self._tmp = temporary_path(self.filename)
+            self.file_descriptor = self._open(self._tmp)
         else:
-            self.file_descriptor = open(self.filename, self.mode)
+            self.file_descriptor = self._open(self.filename)
 
         return self.file_descriptor
 
-    def __exit__(self, *args):
-        self.file_descriptor.close()
+    def __exit__(self, exc_type, *args):
+        if self._writer is not None:
+            if exc_type is None:
+                with self._lock:
+                    self._text = self.file_descriptor.getvalue()
+                self._writer.request()
+            self.file_descriptor.close()
+        elif self._tmp is not None:
+            tmp = self._tmp
+            self._tmp = None
+            self.file_descriptor.close()
+            if exc_type is None:
+                replace_file(tmp, self.filename)
+            else:
+                # Leave the original file as it was
+                os.remove(tmp)
+        else:
+            self.file_descriptor.close()
+
+    def flush(self, wait=True):
+        """Write any text waiting in the background writer.
 
-    def read_header(self):
+        Parameters
+        ----------
+        wait : bool (optional)
+            Wait until the text is safely on disk. Defaults to True.
+        """
+        if self._writer is not None:
+            self._writer.flush(wait=wait)
+
+    def _open(self, path):
+        """Open the path with the mode and compression of this file."""
         if self.compression == "bzip2":
-            with bz2.open(self.filename, "rt") as fd:
-                line = next(fd)
+            return bz2.open(path, self.mode + "t")
         elif self.compression == "gzip":
-            with gzip.open(self.filename, "rt") as fd:
-                line = next(fd)
+            return gzip.open(path, self.mode + "t")
         else:
-            with open(self.filename, "r"):
-                line = next(fd)
-
-        if line[0] == "!" and len(line.split()) == 3:
-            organization, filetype, version = line[1:].split()
-            logger.info(
-                "reading '{}', a {} file from {}, version {}".format(
-                    self.filename, filetype, organization, version
-                )
+            return open(path, self.mode)
+
+    def _write_text(self):
+        """Write the latest text to the file. Used by the background thread."""
+        with self._lock:
+            text = self._text
+            self._text = None
+        if text is None:
+            return
+        tmp = temporary_path(self.filename)
+        with self._open(tmp) as fd:
+            fd.write(text)
+        replace_file(tmp, self.filename)
+
+    def read_header(self):
+        """Read the header line, setting the organization, filetype and version.
+
+        Returns
+        -------
+        (str, str, str)
+            The organization, filetype and version.
+        """
+        header = sniff_header(self.filename)
+        if header is None:
+            raise RuntimeError(
+                "reading '{}', expected a header line".format(self.filename)
+            )
+        self.organization, self.filetype, self.version, compression = header
+        logger.info(
+            "reading '{}', a {} file from {}, version {}".format(
+                self.filename, self.filetype, self.organization, self.version
             )
+        )
+        return self.organization, self.filetype, self.version
+
+
+class ColumnarFile(object):
+    """A SEAMM file holding a table of typed columns in binary.
+
+    The file starts with the usual header line, "!organization filetype
+    version", followed by a line "!columnar {...}" with the JSON description of
+    the columns. The rest of the file is a sequence of chunks, each holding a
+    block of rows::
+
+        b"SCHK", number of rows (uint64), number of columns (uint32),
+        size of each column's data (uint64 each),
+        the data for each column, each padded to 8 bytes
+
+    The data for each column is the raw little-endian values, optionally
+    compressed with zlib. Rows are appended as new chunks without rewriting
+    the file, and a single column can be read without reading the others.
+    Uncompressed files are memory-mapped, so reading a column is zero-copy
+    when it is in a single chunk.
+    """
+
+    magic = b"SCHK"
+    _chunk_header = struct.Struct("<4sQI")
+    _size = struct.Struct("<Q")
+
+    def __init__(
+        self,
+        filename,
+        mode="r",
+        organization="MolSSI",
+        filetype=None,
+        version=None,
+        columns=None,
+        compression="zlib",
+        chunk_rows=65536,
+    ):
+        """
+        Parameters
+        ----------
+        filename : str or pathlib.Path
+            The path to the file.
+        mode : str (optional)
+            "r" to read, "w" to create, or "a" to append rows.
+        organization : str (optional)
+            The organization that defined the file type. Defaults to "MolSSI".
+        filetype : str (optional)
+            The type of file, needed to create a file.
+        version : str (optional)
+            The version of the file type, needed to create a file.
+        columns : {str: numpy.dtype} (optional)
+            The names and types of the columns, needed to create a file.
+        compression : str (optional)
+            "zlib" or "none", for creating a file. Defaults to "zlib".
+        chunk_rows : int (optional)
+            The maximum number of rows in a chunk. Defaults to 65536.
+        """
+        self.filename = os.fspath(filename)
+        self.mode = mode
+        self.chunk_rows = chunk_rows
+        self._chunks = []  # (first row, number of rows, [(offset, size)])
+        self._map = None
+
+        if mode == "w":
+            if filetype is None:
+                raise ValueError("Filetype must be given for writable files!")
+            if version is None:
+                raise ValueError("Version must be given for writable files!")
+            if columns is None or len(columns) == 0:
+                raise ValueError("Columns must be given for writable files!")
+            if compression not in ("zlib", "none"):
+                raise ValueError("Invalid compression: '{}'".format(compression))
+            self.organization = organization
+            self.filetype = filetype
+            self.version = version
+            self.compression = compression
+            self.columns = {}
+            for name, dtype in columns.items():
+                dtype = np.dtype(dtype)
+                if dtype.hasobject:
+                    raise ValueError(f"Column '{name}' cannot hold Python objects.")
+                self.columns[name] = dtype.newbyteorder("<")
+            schema = {
+                "compression": compression,
+                "columns": [[k, v.str] for k, v in self.columns.items()],
+            }
+            header = f"!{organization} {filetype} {version}\n".encode()
+            header += b"!columnar " + json.dumps(schema).encode()
+            # Pad so that the data is aligned on 8 bytes
+            header += b" " * (self._padded(len(header) + 1) - len(header) - 1)
+            with open(self.filename, "wb") as fd:
+                fd.write(header + b"\n")
+                self._end = fd.tell()
+        elif mode in ("r", "a"):
+            self._read_directory()
         else:
-            raise RuntimeError(
-                "reading '{}', expected a header line but got\n\t'{}'".format(
-                    self.filename, line
-                )
+            raise ValueError("Invalid mode: '{}'".format(mode))
+
+    def __len__(self):
+        """The number of rows."""
+        if len(self._chunks) == 0:
+            return 0
+        first, n_rows, blocks = self._chunks[-1]
+        return first + n_rows
+
+    def append(self, **columns):
+        """Append rows to the file, without rewriting it.
+
+        Parameters
+        ----------
+        columns : {str: array-like}
+            The values for every column, all of the same length.
+        """
+        if self.mode == "r":
+            raise RuntimeError("Cannot append to a file opened for reading.")
+        if set(columns) != set(self.columns):
+            raise ValueError(
+                f"Need values for the columns {', '.join(self.columns)}, "
+                f"not {', '.join(columns)}"
             )
+        data = {
+            name: np.ascontiguousarray(columns[name], dtype=dtype)
+            for name, dtype in self.columns.items()
+        }
+        n_rows = {len(values) for values in data.values()}
+        if len(n_rows) != 1:
+            raise ValueError("The columns must all have the same length.")
+        n_rows = n_rows.pop()
+
+        self._close_map()
+        with open(self.filename, "r+b") as fd:
+            fd.seek(self._end)
+            for start in range(0, n_rows, self.chunk_rows):
+                stop = min(start + self.chunk_rows, n_rows)
+                self._write_chunk(fd, {k: v[start:stop] for k, v in data.items()})
+            fd.truncate()
+            self._end = fd.tell()
+
+    def column(self, name, start=0, stop=None):
+        """The values of one column, reading only that column.
+
+        Parameters
+        ----------
+        name : str
+            The column.
+        start, stop : int (optional)
+            The range of rows, as for a slice. Defaults to all rows.
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+        return self.read([name], start=start, stop=stop)[name]
+
+    def read(self, columns=None, start=0, stop=None):
+        """Read some or all of the columns for a range of rows.
+
+        Parameters
+        ----------
+        columns : [str] (optional)
+            The columns to read. Defaults to all the columns.
+        start, stop : int (optional)
+            The range of rows, as for a slice. Defaults to all rows.
+
+        Returns
+        -------
+        {str: numpy.ndarray}
+        """
+        if columns is None:
+            columns = list(self.columns)
+        for name in columns:
+            if name not in self.columns:
+                raise KeyError(f"Column '{name}' does not exist.")
+        start, stop, step = slice(start, stop).indices(len(self))
+
+        names = list(self.columns)
+        parts = {name: [] for name in columns}
+        with open(self.filename, "rb") as fd:
+            for first, n_rows, blocks in self._chunks:
+                if first + n_rows <= start or first >= stop:
+                    continue
+                lo = max(start - first, 0)
+                hi = min(stop - first, n_rows)
+                for name in columns:
+                    offset, size = blocks[names.index(name)]
+                    values = self._read_block(fd, offset, size, self.columns[name])
+                    parts[name].append(values[lo:hi])
+
+        result = {}
+        for name in columns:
+            if len(parts[name]) == 1:
+                result[name] = parts[name][0]
+            elif len(parts[name]) == 0:
+                result[name] = np.empty(0, dtype=self.columns[name])
+            else:
+                result[name] = np.concatenate(parts[name])
+        return result
+
+    def _close_map(self):
+        """Forget the memory map, which is out of date after appending."""
+        self._map = None
+
+    def _read_block(self, fd, offset, size, dtype):
+        """Read the values of a column in a chunk."""
+        if self.compression == "none":
+            if self._map is None:
+                self._map = np.memmap(self.filename, dtype=np.uint8, mode="r")
+            return self._map[offset : offset + size].view(dtype)
+        fd.seek(offset)
+        return np.frombuffer(zlib.decompress(fd.read(size)), dtype=dtype)
+
+    def _read_directory(self):
+        """Read the header and schema, and find the chunks.
+
+        A partial chunk at the end, from a crash while appending, is ignored
+        and is overwritten by the next append.
+        """
+        with open(self.filename, "rb") as fd:
+            line = fd.readline().decode()
+            if line[0:1] != "!" or len(line.split()) != 3:
+                raise RuntimeError(
+                    "reading '{}', expected a header line but got\n\t'{}'".format(
+                        self.filename, line
+                    )
+                )
+            self.organization, self.filetype, self.version = line[1:].split()
+            line = fd.readline()
+            if not line.startswith(b"!columnar "):
+                raise RuntimeError(f"'{self.filename}' is not a columnar file.")
+            schema = json.loads(line[10:])
+            self.compression = schema["compression"]
+            self.columns = {name: np.dtype(dtype) for name, dtype in schema["columns"]}
+
+            file_size = os.fstat(fd.fileno()).st_size
+            n_columns = len(self.columns)
+            first = 0
+            self._end = fd.tell()
+            while True:
+                header = fd.read(self._chunk_header.size + 8 * n_columns)
+                if len(header) < self._chunk_header.size + 8 * n_columns:
+                    break
+                magic, n_rows, n = self._chunk_header.unpack_from(header)
+                if magic != self.magic or n != n_columns:
+                    break
+                offset = fd.tell()
+                blocks = []
+                for i in range(n_columns):
+                    size = self._size.unpack_from(
+                        header, self._chunk_header.size + 8 * i
+                    )[0]
+                    blocks.append((offset, size))
+                    offset += self._padded(size)
+                if offset > file_size:
+                    break
+                self._chunks.append((first, n_rows, blocks))
+                first += n_rows
+                fd.seek(offset)
+                self._end = offset
+            if self._end != file_size:
+                logger.warning(
+                    f"Ignoring a partial chunk at the end of {self.filename}, "
+                    "probably from a crash."
+                )
+
+    @staticmethod
+    def _padded(size):
+        """The size rounded up to a multiple of 8 bytes."""
+        return (size + 7) & ~7
+
+    def _write_chunk(self, fd, data):
+        """Write a chunk of rows at the current position."""
+        blocks = []
+        for name, values in data.items():
+            block = values.tobytes()
+            if self.compression == "zlib":
+                block = zlib.compress(block)
+            blocks.append(block)
+        n_rows = len(next(iter(data.values())))
+        fd.write(self._chunk_header.pack(self.magic, n_rows, len(blocks)))
+        for block in blocks:
+            fd.write(self._size.pack(len(block)))
+
+        offset = fd.tell()
+        first = len(self)
+        sizes = []
+        for block in blocks:
+            fd.write(block)
+            fd.write(b"\0" * (self._padded(len(block)) - len(block)))
+            sizes.append((offset, len(block)))
+            offset += self._padded(len(block))
+        self._chunks.append((first, n_rows, sizes))
@@ -4,7 +4,16 @@
 
 import math
 
-import seamm_util
+import numpy as np
+
+from . import elemental_data
+
+# Avogadro's number, per mole
+_avogadro = 6.02214076e23
+
+# The dtype of the array of bonds in array-backed systems. The atoms are
+# 1-based, as in the list of bonds in ordinary systems.
+bond_dtype = np.dtype([("i", np.int64), ("j", np.int64), ("order", "U6")])
 
 
 class Water(object):
@@ -53,63 +62,113 @@ class Water(object):
         At the moment, the atoms are 0-based, but the bonds are given using
         1-based atom numbers!
 
+        The search is vectorized with NumPy, using the bonds as a compressed
+        sparse row (CSR) adjacency list.
+
         Parameters
         ----------
         system : System object
 
         Returns
         -------
-
+        numpy.ndarray(n_waters, 3)
+            The 0-based indices of the oxygen and the two hydrogens, in
+            increasing order, for each water molecule.
         """
-        elements = system["atoms"]["elements"]
+        elements = np.asarray(system["atoms"]["elements"])
         n_atoms = len(elements)
 
-        # List the bonds, ordering the two atoms.
-        bonds = []
-        for i, j, order in system["bonds"]:
-            i -= 1
-            j -= 1
-            if i < j:
-                bonds.append((i, j))
-            else:
-                bonds.append((j, i))
+        bonds = system["bonds"]
+        if isinstance(bonds, np.ndarray) and bonds.dtype.names is not None:
+            bonds = np.column_stack((bonds["i"], bonds["j"]))
+        else:
+            bonds = np.array([(i, j) for i, j, order in bonds], dtype=np.int64)
+        bonds = bonds.astype(np.int64).reshape(-1, 2) - 1
+
+        # The adjacency as CSR: the neighbors of atom i are
+        # indices[indptr[i]:indptr[i + 1]]
+        degree = np.bincount(bonds.ravel(), minlength=n_atoms)
+        rows = np.concatenate((bonds[:, 0], bonds[:, 1]))
+        columns = np.concatenate((bonds[:, 1], bonds[:, 0]))
+        indices = columns[np.argsort(rows, kind="stable")]
+        indptr = np.zeros(n_atoms + 1, dtype=np.int64)
+        np.cumsum(degree, out=indptr[1:])
 
-        # atoms bonded to each atom i
-        bonded_to = []
-        for i in range(n_atoms):
-            bonded_to.append([])
-        for i, j in bonds:
-            bonded_to[i].append(j)
-            bonded_to[j].append(i)
+        # Now find water molecules by looking for an O attached to two H's
+        oxygens = np.nonzero((elements == "O") & (degree == 2))[0]
+        hydrogens = indices[indptr[oxygens, np.newaxis] + np.arange(2)]
+        hydrogens.sort(axis=1)
+        is_water = np.all(
+            (elements[hydrogens] == "H") & (degree[hydrogens] == 1), axis=1
+        )
 
-        n_bonds = []
-        for i in range(n_atoms):
-            bonded_to[i].sort()
-            n_bonds.append(len(bonded_to[i]))
+        return np.column_stack((oxygens[is_water], hydrogens[is_water]))
 
-        # Now find water molecules by looking for an O attached to two H's
-        waters = []
-        for i in range(n_atoms):
-            if elements[i] == "O" and n_bonds[i] == 2:
-                h1, h2 = bonded_to[i]
-                if (
-                    elements[h1] == "H"
-                    and n_bonds[h1] == 1
-                    and elements[h2] == "H"
-                    and n_bonds[h2] == 1
-                ):
-                    if h1 < h1:
-                        waters.append((i, h1, h2))
-                    else:
-                        waters.append((i, h2, h1))
-        return waters
+    def constraints(self, waters):
+        """The constraints to hold all the waters rigid, in bulk.
+
+        Parameters
+        ----------
+        waters : numpy.ndarray(n, 3) or System object
+            The 0-based indices of the O, H, H atoms of each water, as from
+            :meth:`find_waters`, or a system to find the waters in.
+
+        Returns
+        -------
+        dict
+            "waters"
+                The (n, 3) array of the atoms in each water.
+            "pairs"
+                The (3n, 2) array of constrained atoms: O-H1, O-H2 and H1-H2
+                for each water in turn.
+            "distances"
+                The (3n,) array of the constrained distances, in Angstrom.
+            "settle"
+                The parameters for the SETTLE algorithm: the masses "mO" and
+                "mH", the distances "dOH" and "dHH", and "ra", "rb" and "rc",
+                the distances from the center of mass to the oxygen and to the
+                line between the hydrogens, and half the H-H distance.
+        """
+        if not isinstance(waters, np.ndarray):
+            waters = self.find_waters(waters)
+        waters = np.asarray(waters, dtype=np.int64).reshape(-1, 3)
+        n = len(waters)
+
+        dOH = self.r0
+        dHH = 2 * self.r0 * math.sin(math.radians(self.theta0 / 2))
+        pairs = waters[:, [[0, 1], [0, 2], [1, 2]]].reshape(3 * n, 2)
+        distances = np.tile([dOH, dOH, dHH], n)
+
+        mO, mH, tmp = self.masses
+        rc = dHH / 2
+        height = math.sqrt(dOH**2 - rc**2)
+        ra = 2 * mH * height / (mO + 2 * mH)
+        rb = height - ra
+        settle = {
+            "mO": mO,
+            "mH": mH,
+            "dOH": dOH,
+            "dHH": dHH,
+            "ra": ra,
+            "rb": rb,
+            "rc": rc,
+        }
+
+        return {
+            "waters": waters,
+            "pairs": pairs,
+            "distances": distances,
+            "settle": settle,
+        }
 
     @property
     def mass(self):
-        mass_oxygen = seamm_util.element_data["O"]["atomic weight"]
-        mass_hydrogen = seamm_util.element_data["H"]["atomic weight"]
+        return sum(self.masses)
 
-        return mass_oxygen + 2 * mass_hydrogen
+    @property
+    def masses(self):
+        """The masses of the O, H and H atoms."""
+        return tuple(elemental_data.masses(["O", "H", "H"]).tolist())
 
     def coordinates(self):
         """A standard set of coordinates in Angstrom
@@ -127,6 +186,168 @@ class Water(object):
 
         return ((0.0, 0.0, 0.0), (x, 0.0, z), (-x, 0.0, z))
 
+    def replicate(self, centers, orientations=None, seed=None):
+        """Make many copies of the water molecule at once.
+
+        The model is rotated about its center of mass and placed at each
+        center, with all the copies handled in one NumPy operation.
+
+        Parameters
+        ----------
+        centers : array-like(n, 3)
+            The positions of the centers of mass, in Angstrom.
+        orientations : array-like(n, 3, 3), optional
+            The rotation matrix for each copy. Defaults to random rotations.
+        seed : int or numpy.random.Generator, optional
+            The seed or generator for the random rotations.
+
+        Returns
+        -------
+        system : dict
+            The waters as an array-backed SEAMM system, with the same keys as
+            :meth:`system` but NumPy arrays for the atoms and a structured
+            array for the bonds.
+        """
+        centers = np.asarray(centers, dtype=float).reshape(-1, 3)
+        n = len(centers)
+        if orientations is None:
+            orientations = random_rotations(n, seed=seed)
+        else:
+            orientations = np.asarray(orientations, dtype=float).reshape(n, 3, 3)
+
+        model = np.array(self.coordinates())
+        masses = np.array(self.masses)
+        model -= masses @ model / masses.sum()
+        xyz = centers[:, np.newaxis, :] + np.einsum("nij,aj->nai", orientations, model)
+
+        atoms = {
+            "names": np.tile(np.array(["O", "H1", "H2"]), n),
+            "elements": np.tile(np.array(["O", "H", "H"]), n),
+            "coordinates": xyz.reshape(-1, 3),
+            "formal charges": np.zeros(3 * n, dtype=int),
+        }
+        if self.qO is not None and self.qH is not None:
+            atoms["charges"] = {"*": np.tile([self.qO, self.qH, self.qH], n)}
+        if hasattr(self, "atom_types"):
+            atoms["atom_types"] = {"*": np.tile(np.array(self.atom_types()), n)}
+
+        return {
+            "periodicity": 0,
+            "atoms": atoms,
+            "bonds": _water_bonds(n),
+            "units": {"coordinates": "angstrom"},
+        }
+
+    def fill_box(self, cell, density=0.997, seed=None):
+        """Fill an orthorhombic box with randomly oriented waters.
+
+        The waters are placed on a grid filling the box, with the number of
+        waters given by the density.
+
+        Parameters
+        ----------
+        cell : array-like(3)
+            The lengths a, b and c of the box, in Angstrom.
+        density : float, optional
+            The density in g/mL. Defaults to 0.997, the density of water at
+            25 C.
+        seed : int or numpy.random.Generator, optional
+            The seed or generator for choosing grid points and rotations.
+
+        Returns
+        -------
+        system : dict
+            The periodic, array-backed SEAMM system. See :meth:`replicate`.
+        """
+        rng = np.random.default_rng(seed)
+        lengths = np.asarray(cell, dtype=float).reshape(3)
+        volume = np.prod(lengths)  # Angstrom^3 = 1.0e-24 mL
+        n = int(round(density * volume * 1.0e-24 * _avogadro / self.mass))
+
+        # A grid with at least n points, spaced evenly in each direction
+        spacing = (volume / max(n, 1)) ** (1 / 3)
+        shape = np.maximum(np.floor(lengths / spacing).astype(int), 1)
+        while np.prod(shape) < n:
+            shape[np.argmax(lengths / shape)] += 1
+        grid = np.indices(shape).reshape(3, -1).T
+        points = rng.choice(len(grid), size=n, replace=False)
+        centers = (grid[points] + 0.5) * (lengths / shape)
+
+        system = self.replicate(centers, seed=rng)
+        system["periodicity"] = 3
+        system["cell"] = [*lengths, 90.0, 90.0, 90.0]
+        return system
+
+    @staticmethod
+    def remove_overlaps(waters, coordinates, tolerance=2.0, cell=None):
+        """Remove the waters that are too close to other atoms.
+
+        A cell list is used to find the close contacts, so the time is close to
+        linear in the number of atoms.
+
+        Parameters
+        ----------
+        waters : dict
+            An array-backed system of waters, as from :meth:`replicate` or
+            :meth:`fill_box`.
+        coordinates : array-like(m, 3)
+            The coordinates of the other atoms, e.g. a solute, in Angstrom.
+        tolerance : float, optional
+            The closest that any atom of a water may be to the other atoms, in
+            Angstrom. Defaults to 2.0.
+        cell : array-like(3), optional
+            The lengths of an orthorhombic periodic cell. Defaults to None, for
+            a non-periodic system.
+
+        Returns
+        -------
+        system : dict
+            The array-backed system with the remaining waters.
+        """
+        triples = Water.find_waters(waters)
+        xyz = np.asarray(waters["atoms"]["coordinates"], dtype=float)
+        close = find_close(xyz[triples.ravel()], coordinates, tolerance, cell=cell)
+        keep = triples[~close.reshape(-1, 3).any(axis=1)]
+
+        atoms = waters["atoms"]
+        index = keep.ravel()
+        result = dict(waters)
+        result["atoms"] = {}
+        for key, value in atoms.items():
+            if isinstance(value, dict):
+                result["atoms"][key] = {
+                    k: np.asarray(v)[index] for k, v in value.items()
+                }
+            else:
+                result["atoms"][key] = np.asarray(value)[index]
+        result["bonds"] = _water_bonds(len(keep))
+        return result
+
+    def solvate(self, coordinates, cell, density=0.997, tolerance=2.0, seed=None):
+        """Fill a periodic box with water, avoiding the given atoms.
+
+        Parameters
+        ----------
+        coordinates : array-like(m, 3)
+            The coordinates of the atoms of the solute, in Angstrom.
+        cell : array-like(3)
+            The lengths a, b and c of the box, in Angstrom.
+        density : float, optional
+            The density in g/mL of the water. Defaults to 0.997.
+        tolerance : float, optional
+            The closest that any atom of a water may be to the solute, in
+            Angstrom. Defaults to 2.0.
+        seed : int or numpy.random.Generator, optional
+            The seed or generator for the placement of the waters.
+
+        Returns
+        -------
+        system : dict
+            The periodic, array-backed system of the waters.
+        """
+        waters = self.fill_box(cell, density=density, seed=seed)
+        return self.remove_overlaps(waters, coordinates, tolerance, cell=cell)
+
     def pdb(self):
         """The contents of a PDB file for this model.
 
@@ -173,6 +394,132 @@ class Water(object):
         return system
 
 
+def find_close(points, others, cutoff, cell=None, chunk_size=65536):
+    """Find the points that are within a cutoff of any of the other points.
+
+    The other points are sorted into a grid of cells at least the cutoff wide,
+    so each point is only compared with the points in the 27 cells around it.
+
+    Parameters
+    ----------
+    points : array-like(n, 3)
+        The points to check.
+    others : array-like(m, 3)
+        The points to check against.
+    cutoff : float
+        The distance.
+    cell : array-like(3), optional
+        The lengths of an orthorhombic periodic cell, in which case the minimum
+        image distances are used. Defaults to None, not periodic.
+    chunk_size : int, optional
+        The number of points to handle at a time, which limits the memory used.
+
+    Returns
+    -------
+    numpy.ndarray(n) of bool
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 3)
+    others = np.asarray(others, dtype=float).reshape(-1, 3)
+    result = np.zeros(len(points), dtype=bool)
+    if len(points) == 0 or len(others) == 0:
+        return result
+
+    if cell is None:
+        origin = np.minimum(points.min(axis=0), others.min(axis=0))
+        lengths = np.maximum(points.max(axis=0), others.max(axis=0)) - origin
+        points = points - origin
+        others = others - origin
+        shape = np.maximum(np.floor(lengths / cutoff).astype(int), 1)
+        width = np.maximum(lengths, cutoff) / shape
+    else:
+        lengths = np.asarray(cell, dtype=float).reshape(3)
+        points = points % lengths
+        others = others % lengths
+        shape = np.maximum(np.floor(lengths / cutoff).astype(int), 1)
+        width = lengths / shape
+
+    # Sort the other points by the cell they are in
+    ijk = np.minimum((others / width).astype(int), shape - 1)
+    ids = np.ravel_multi_index(ijk.T, shape)
+    order = np.argsort(ids, kind="stable")
+    counts = np.bincount(ids, minlength=np.prod(shape))
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+    offsets = np.indices((3, 3, 3)).reshape(3, -1).T - 1
+    cutoff2 = cutoff * cutoff
+    for first in range(0, len(points), chunk_size):
+        chunk = points[first : first + chunk_size]
+        home = np.minimum((chunk / width).astype(int), shape - 1)
+        close = np.zeros(len(chunk), dtype=bool)
+        for offset in offsets:
+            neighbor = home + offset
+            if cell is None:
+                valid = np.all((neighbor >= 0) & (neighbor < shape), axis=1)
+            else:
+                neighbor %= shape
+                valid = np.ones(len(chunk), dtype=bool)
+            which = np.nonzero(valid & ~close)[0]
+            cells = np.ravel_multi_index(neighbor[which].T, shape)
+            n = counts[cells]
+            if n.sum() == 0:
+                continue
+
+            # All pairs of these points and the other points in the cells
+            pairs = np.repeat(which, n)
+            within = np.arange(n.sum()) - np.repeat(np.cumsum(n) - n, n)
+            partners = order[np.repeat(starts[cells], n) + within]
+            delta = chunk[pairs] - others[partners]
+            if cell is not None:
+                delta -= lengths * np.round(delta / lengths)
+            hit = np.einsum("ij,ij->i", delta, delta) < cutoff2
+            close[pairs[hit]] = True
+        result[first : first + chunk_size] = close
+    return result
+
+
+def _water_bonds(n):
+    """The bonds for n waters, stored as O, H, H for each water."""
+    oxygens = 3 * np.arange(n, dtype=np.int64) + 1
+    bonds = np.empty(2 * n, dtype=bond_dtype)
+    bonds["i"] = np.repeat(oxygens, 2)
+    bonds["j"] = np.column_stack((oxygens + 1, oxygens + 2)).ravel()
+    bonds["order"] = "single"
+    return bonds
+
+
+def random_rotations(n, seed=None):
+    """Uniformly distributed random rotation matrices.
+
+    Parameters
+    ----------
+    n : int
+        The number of rotations.
+    seed : int or numpy.random.Generator, optional
+        The seed or generator for the random numbers.
+
+    Returns
+    -------
+    numpy.ndarray(n, 3, 3)
+    """
+    rng = np.random.default_rng(seed)
+    # Random unit quaternions are uniformly distributed rotations
+    w, x, y, z = rng.normal(size=(4, n))
+    norm = np.sqrt(w * w + x * x + y * y + z * z)
+    w, x, y, z = w / norm, x / norm, y / norm, z / norm
+
+    result = np.empty((n, 3, 3))
+    result[:, 0, 0] = 1 - 2 * (y * y + z * z)
+    result[:, 0, 1] = 2 * (x * y - z * w)
+    result[:, 0, 2] = 2 * (x * z + y * w)
+    result[:, 1, 0] = 2 * (x * y + z * w)
+    result[:, 1, 1] = 1 - 2 * (x * x + z * z)
+    result[:, 1, 2] = 2 * (y * z - x * w)
+    result[:, 2, 0] = 2 * (x * z - y * w)
+    result[:, 2, 1] = 2 * (y * z + x * w)
+    result[:, 2, 2] = 1 - 2 * (x * x + y * y)
+    return result
+
+
 class SPC(Water):
     def __init__(self):
         super().__init__(1.0, 109.47, -0.82, 0.41)
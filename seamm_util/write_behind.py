@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+
+"""Helpers for writing files safely and in the background.
+
+Files are written to a temporary file in the same directory, which is synced
+to disk and then renamed over the original, so a crash part way through never
+leaves a partially written file.
+
+The WriteBehind class runs a write function in a background thread, gathering
+all the requests made within a short window into a single write.
+"""
+
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def temporary_path(path):
+    """The temporary file to write before replacing 'path'.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        The file to be replaced.
+
+    Returns
+    -------
+    str
+    """
+    path = os.fspath(path)
+    directory, name = os.path.split(path)
+    return os.path.join(directory, f".{name}.{os.getpid()}.tmp")
+
+
+def replace_file(tmp, path):
+    """Sync a temporary file to disk and atomically rename it to 'path'.
+
+    Parameters
+    ----------
+    tmp : str or pathlib.Path
+        The temporary file, which must be closed.
+    path : str or pathlib.Path
+        The file to replace.
+    """
+    fd = os.open(tmp, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+    # Make the rename itself durable, where the OS allows it
+    directory = os.path.dirname(os.path.abspath(path))
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class WriteBehind(object):
+    """Run a write function in a background thread, coalescing requests.
+
+    After a request the thread waits for the window to gather any further
+    requests, then calls the write function once. The thread exits when there
+    is nothing more to write, so pending writes are completed before the
+    interpreter exits.
+    """
+
+    def __init__(self, write, window=1.0, name="write-behind"):
+        """
+        Parameters
+        ----------
+        write : function
+            The function to call to do the writing.
+        window : float (optional)
+            The time in seconds to gather requests. Defaults to 1 second.
+        name : str (optional)
+            The name for the thread.
+        """
+        self._write = write
+        self._window = window
+        self._name = name
+        self._condition = threading.Condition()
+        self._thread = None
+        self._pending = False
+        self._busy = False
+        self._now = False
+        self._error = None
+
+    @property
+    def pending(self):
+        """Whether there is a write waiting or in progress."""
+        with self._condition:
+            return self._pending or self._busy
+
+    def request(self):
+        """Ask for a write, which happens after the window."""
+        with self._condition:
+            self._pending = True
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self._name)
+                self._thread.start()
+
+    def flush(self, wait=True):
+        """Write any pending request now, optionally waiting for it.
+
+        Parameters
+        ----------
+        wait : bool (optional)
+            Wait for the write to finish, raising any error from it.
+        """
+        with self._condition:
+            if self._pending:
+                self._now = True
+                self._condition.notify_all()
+            if wait:
+                while self._pending or self._busy:
+                    self._condition.wait()
+                if self._error is not None:
+                    error = self._error
+                    self._error = None
+                    raise error
+
+    def _run(self):
+        """The body of the background thread."""
+        while True:
+            with self._condition:
+                deadline = time.monotonic() + self._window
+                while not self._now:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                self._pending = False
+                self._now = False
+                self._busy = True
+            try:
+                self._write()
+            except Exception as e:
+                logger.exception(f"Error in the {self._name} thread.")
+                self._error = e
+            with self._condition:
+                self._busy = False
+                if not self._pending:
+                    self._thread = None
+                    self._condition.notify_all()
+                    return
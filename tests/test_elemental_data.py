@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `seamm_util` package, elemental_data module."""
+
+import numpy as np
+import pytest
+
+from seamm_util import element_data
+from seamm_util import elemental_data
+
+
+def test_symbols_to_numbers():
+    """Testing converting symbols to atomic numbers."""
+    assert elemental_data.symbols_to_numbers("C") == 6
+    numbers = elemental_data.symbols_to_numbers(["O", "H", "H", "Og", "H"])
+    assert numbers.tolist() == [8, 1, 1, 118, 1]
+    with pytest.raises(KeyError):
+        elemental_data.symbols_to_numbers(["O", "Xx"])
+
+
+def test_numbers_to_symbols():
+    """Testing converting atomic numbers to symbols."""
+    assert elemental_data.numbers_to_symbols(26) == "Fe"
+    assert elemental_data.numbers_to_symbols([8, 1, 1]).tolist() == ["O", "H", "H"]
+    with pytest.raises(ValueError):
+        elemental_data.numbers_to_symbols([0])
+
+
+def test_masses():
+    """Testing that the masses agree with the table."""
+    symbols = list(element_data)
+    expected = [element_data[symbol]["atomic weight"] for symbol in symbols]
+    assert elemental_data.masses(symbols).tolist() == expected
+    numbers = np.arange(1, len(symbols) + 1)
+    assert elemental_data.masses(numbers).tolist() == expected
+    assert elemental_data.masses("O") == element_data["O"]["atomic weight"]
+
+
+def test_formula():
+    """Testing the Hill formula and molecular weight."""
+    ethanol = ["C", "C", "O", "H", "H", "H", "H", "H", "H"]
+    assert elemental_data.formula(ethanol) == "C2H6O"
+    assert elemental_data.formula(["Na", "Cl", "H", "O", "H"]) == "ClH2NaO"
+
+    formula, weight = elemental_data.formula_and_weight(ethanol)
+    assert formula == "C2H6O"
+    assert weight == pytest.approx(
+        sum(element_data[symbol]["atomic weight"] for symbol in ethanol)
+    )
+
+
+def test_many_structures():
+    """Testing the composition of many structures at once."""
+    elements = [8, 1, 1, 6, 8, 8, 26]
+    structures = [0, 0, 0, 1, 1, 1, 3]
+    counts = elemental_data.composition(elements, structures)
+    assert counts.shape == (4, elemental_data.n_elements + 1)
+    assert elemental_data.formula(elements, structures) == ["H2O", "CO2", "", "Fe"]
+
+    weights = elemental_data.molecular_weight(elements, structures)
+    assert weights[3] == element_data["Fe"]["atomic weight"]
+    assert weights[2] == 0.0
+
+    densities = elemental_data.density(elements, structures)
+    assert densities[3] == pytest.approx(element_data["Fe"]["density"])
@@ -3,6 +3,8 @@
 
 """Tests for `seamm_util` package."""
 
+import asyncio
+
 import seamm_util
 from pathlib import Path
 
@@ -250,3 +252,312 @@ def test_push():
             i += 1
             if i == 7:
                 fd.push(2)
+
+
+def test_seek_line():
+    """Testing jumping to a line in an included file"""
+    filepath = datapath / "file_include1.txt"
+    data = [
+        "file_include1 line1",
+        "file_end line 1",
+        "file_end line 2",
+        "file_end line 3",
+        "file1 line 1",
+        "file1 line 2",
+        "file1 line 3",
+        "file1 line 4",
+    ]
+
+    with seamm_util.Open(filepath, "r", include="include") as fd:
+        assert len(fd.index) == len(data)
+        fd.seek_line(5)
+        assert fd.lineno == 1
+        lines = [line.strip() for line in fd]
+        assert lines == data[5:]
+
+        fd.seek_line(1)
+        assert next(fd).strip() == data[1]
+        assert [Path(x).name for x in fd.stack()] == [
+            "file_end.txt:1",
+            "file_include1.txt:2",
+        ]
+        assert fd.total_lines == 3
+
+
+def test_seek_line_back(tmp_path):
+    """Testing that seeking back after reading processes includes again"""
+    (tmp_path / "b.txt").write_text("b1\nb2\n")
+    filepath = tmp_path / "a.txt"
+    filepath.write_text("a1\ninclude b.txt\na2\n")
+
+    with seamm_util.Open(filepath, include="include") as fd:
+        lines = [line.strip() for line in fd]
+        assert lines == ["a1", "b1", "b2", "a2"]
+        for n in range(len(lines)):
+            fd.seek_line(n)
+            assert [line.strip() for line in fd] == [x.strip() for x in fd[n:]]
+        fd.seek_line(0)
+        assert [line.strip() for line in fd] == lines
+
+
+def test_seek_line_forward(tmp_path):
+    """Testing that seeking forward restores the includes already used"""
+    (tmp_path / "c.txt").write_text("c1\n")
+    filepath = tmp_path / "d.txt"
+    filepath.write_text("a1\ninclude c.txt\na2\ninclude c.txt\na3\n")
+
+    with seamm_util.Open(filepath, include="include") as fd:
+        assert [line.strip() for line in fd[:]] == ["a1", "c1", "a2", "c1", "a3"]
+        fd.seek_line(2)
+        assert [name for name, path in fd.visited] == ["", "c.txt"]
+        assert [line.strip() for line in fd] == ["a2", "c1", "a3"]
+        assert [name for name, path in fd.visited] == ["", "c.txt", "c.txt"]
+        fd.seek_line(4)
+        assert [line.strip() for line in fd] == ["a3"]
+        assert [name for name, path in fd.visited] == ["", "c.txt", "c.txt"]
+
+
+def test_slice():
+    """Testing random access to lines across the include tree"""
+    filepath = datapath / "file_middle.txt"
+    data = [
+        "file_middle line 1",
+        "file_middle line 2",
+        "file1 line 1",
+        "file1 line 2",
+        "file1 line 3",
+        "file1 line 4",
+        "file_middle line 3",
+    ]
+
+    with seamm_util.Open(filepath, "r", include="include") as fd:
+        assert [line.strip() for line in fd[1:4]] == data[1:4]
+        assert [line.strip() for line in fd[::-2]] == data[::-2]
+        assert fd[-1].strip() == data[-1]
+        # Random access doesn't move the iterator
+        assert next(fd).strip() == data[0]
+
+
+def test_persist_index(tmp_path):
+    """Testing that the index is saved and reused"""
+    for name in ("file_middle.txt", "file1.txt"):
+        (tmp_path / name).write_text((datapath / name).read_text())
+    filepath = tmp_path / "file_middle.txt"
+
+    with seamm_util.Open(filepath, include="include", persist_index=True) as fd:
+        assert fd[2].strip() == "file1 line 1"
+    sidecar = tmp_path / "file_middle.txt.lidx"
+    assert sidecar.exists()
+
+    index = seamm_util.include_open.LineIndex.load(sidecar, include="include")
+    assert index is not None and len(index) == 7
+
+    # Changing an included file invalidates the index
+    (tmp_path / "file1.txt").write_text("new line 1\n")
+    assert seamm_util.include_open.LineIndex.load(sidecar, include="include") is None
+    with seamm_util.Open(filepath, include="include", persist_index=True) as fd:
+        assert len(fd.index) == 4
+        assert fd[2].strip() == "new line 1"
+
+
+def test_binary():
+    """Testing reading lines as bytes from memory-mapped files"""
+    filepath = datapath / "file_middle.txt"
+    data = [
+        b"file_middle line 1",
+        b"file_middle line 2",
+        b"file1 line 1",
+        b"file1 line 2",
+        b"file1 line 3",
+        b"file1 line 4",
+        b"file_middle line 3",
+    ]
+
+    with seamm_util.Open(filepath, "rb", include="include") as fd:
+        lines = [line.strip() for line in fd]
+        assert lines == data
+        assert fd.total_lines == 8
+
+        fd.seek_line(3)
+        assert next(fd).strip() == data[3]
+        assert fd[6].strip() == data[6]
+
+
+def test_view():
+    """Testing a zero-copy view of a block of lines"""
+    filepath = datapath / "file_middle.txt"
+
+    with seamm_util.Open(filepath, "rb", include="include") as fd:
+        next(fd)
+        next(fd)
+        next(fd)
+        view = fd.view(2)
+        assert isinstance(view, memoryview)
+        assert bytes(view) == b"file1 line 2\nfile1 line 3\n"
+        assert fd.lineno == 3
+        assert bytes(fd.view()) == b"file1 line 4\n"
+        assert next(fd).strip() == b"file_middle line 3"
+
+
+def test_include_twice(tmp_path):
+    """Testing that a file can be included more than once"""
+    (tmp_path / "file1.txt").write_text((datapath / "file1.txt").read_text())
+    filepath = tmp_path / "twice.txt"
+    filepath.write_text("include file1.txt\nmiddle\ninclude file1.txt\nend\n")
+
+    with seamm_util.Open(filepath, include="include") as fd:
+        lines = [line.strip() for line in fd]
+        assert len(fd.index) == len(lines)
+        assert [name for name, path in fd.visited] == ["", "file1.txt", "file1.txt"]
+        graph = fd.include_graph()
+    file1 = [f"file1 line {i}" for i in range(1, 5)]
+    assert lines == [*file1, "middle", *file1, "end"]
+    assert graph[filepath] == [tmp_path / "file1.txt", tmp_path / "file1.txt"]
+
+
+def test_include_recursive(tmp_path):
+    """Testing that a file including itself is not followed"""
+    (tmp_path / "b.txt").write_text("b1\ninclude a.txt\nb2\n")
+    filepath = tmp_path / "a.txt"
+    filepath.write_text("a1\ninclude b.txt\ninclude a.txt\na2\n")
+
+    with seamm_util.Open(filepath, include="include") as fd:
+        lines = [line.strip() for line in fd]
+        assert fd[:] == [line + "\n" for line in lines]
+    assert lines == ["a1", "b1", "b2", "a2"]
+
+
+def test_include_deleted(tmp_path):
+    """Testing that a cached include of a deleted file is not used"""
+    (tmp_path / "c.txt").write_text("c1\n")
+    filepath = tmp_path / "a.txt"
+    filepath.write_text("a1\ninclude c.txt missing_ok\na2\n")
+
+    def read():
+        with seamm_util.Open(filepath, include="include") as fd:
+            return [line.strip() for line in fd]
+
+    assert read() == ["a1", "c1", "a2"]
+    (tmp_path / "c.txt").unlink()
+    assert read() == ["a1", "a2"]
+
+
+def test_include_graph():
+    """Testing resolving the include graph without reading the files"""
+    filepath = datapath / "file_include1.txt"
+
+    with seamm_util.Open(filepath, "r", include="include") as fd:
+        graph = fd.include_graph()
+    graph = {k.name: [v.name for v in values] for k, values in graph.items()}
+    assert graph == {
+        "file_include1.txt": ["file_end.txt"],
+        "file_end.txt": ["file1.txt"],
+        "file1.txt": [],
+    }
+
+
+def test_async_open():
+    """Testing reading asynchronously, with includes and history"""
+    filepath = datapath / "file_include1.txt"
+    cwd = Path(__file__).parent
+
+    async def read(path):
+        lines = []
+        stack = None
+        async with seamm_util.AsyncOpen(path, include="include", chunk_size=2) as fd:
+            async for line in fd:
+                lines.append((line.strip(), fd.lineno, fd.total_lines))
+                if len(lines) == 5:
+                    stack = [str(Path(x).relative_to(cwd)).lower() for x in fd.stack()]
+                if len(lines) == 7:
+                    fd.push(2)
+                    assert await fd.__anext__() == "file1 line 2\n"
+        return lines, stack
+
+    async def read_many():
+        return await asyncio.gather(*[read(filepath) for i in range(4)])
+
+    expected = []
+    with seamm_util.Open(filepath, include="include") as fd:
+        for line in fd:
+            expected.append((line.strip(), fd.lineno, fd.total_lines))
+
+    for lines, stack in asyncio.run(read_many()):
+        assert lines[0:7] == expected[0:7]
+        assert [x[0] for x in lines[7:]] == ["file1 line 3", "file1 line 4"]
+        assert stack == [
+            "data/file1.txt:1",
+            "data/file_end.txt:4",
+            "data/file_include1.txt:2",
+        ]
+
+
+def test_expand_cache(tmp_path):
+    """Testing reading the cached, expanded file with its source map"""
+    filepath = datapath / "file_include1.txt"
+    cache = tmp_path / "cache"
+
+    def read(**kwargs):
+        result = []
+        with seamm_util.Open(filepath, include="include", **kwargs) as fd:
+            for line in fd:
+                result.append(
+                    (line, fd.lineno, fd.total_lines, fd.stack(), list(fd.visited))
+                )
+            total = fd.total_lines, fd.visited
+        return result, total
+
+    expected = read()
+    assert read(expand_cache=cache) == expected
+    assert len(list(cache.glob("*.txt"))) == 1
+    assert len(list(cache.glob("*.lidx"))) == 1
+
+    # The second time reads the cached file.
+    for path in cache.glob("*.txt"):
+        path.write_text(path.read_text().replace("line", "LINE"))
+    lines, total = read(expand_cache=cache)
+    assert lines[-1][0] == "file1 LINE 4\n"
+    assert lines[-1][1:] == expected[0][-1][1:]
+
+
+def test_expand_cache_no_newline(tmp_path):
+    """Testing the expanded file when included files lack a final newline"""
+    (tmp_path / "b.txt").write_text("b1\nb2")
+    filepath = tmp_path / "a.txt"
+    filepath.write_text("a1\ninclude b.txt\na2")
+    cache = tmp_path / "cache"
+
+    def read(**kwargs):
+        result = []
+        with seamm_util.Open(filepath, include="include", **kwargs) as fd:
+            for line in fd:
+                result.append((line, fd.lineno, fd.stack()))
+        return result
+
+    expected = read()
+    assert [x[0] for x in expected] == ["a1\n", "b1\n", "b2", "a2"]
+    assert read(expand_cache=cache) == expected
+    assert read(expand_cache=cache) == expected
+    assert list(cache.glob(".*.tmp")) == []
+
+
+def test_expand_cache_uri_handler(tmp_path):
+    """Testing that the expanded file depends on the URI handler"""
+    (tmp_path / "b.txt").write_text("b\n")
+    (tmp_path / "c.txt").write_text("c\n")
+    filepath = tmp_path / "a.txt"
+    filepath.write_text("include data:x.txt\n")
+    cache = tmp_path / "cache"
+
+    def handler_b(path):
+        return tmp_path / str(path).replace("data:x", "b")
+
+    def handler_c(path):
+        return tmp_path / str(path).replace("data:x", "c")
+
+    for handler, expected in ((handler_b, "b\n"), (handler_c, "c\n")):
+        with seamm_util.Open(
+            filepath, include="include", uri_handler=handler, expand_cache=cache
+        ) as fd:
+            assert list(fd) == [expected]
+    assert len(list(cache.glob("*.txt"))) == 2
@@ -243,3 +243,23 @@ def test_push():
             i += 1
             if i == 7:
                 fd.push(2)
+
+
+def test_seek_line():
+    """Testing jumping to a line in a compressed, included file"""
+    filepath = datapath / "file_include1.txt.gz"
+    data = [
+        "file_include1 line1",
+        "file_end line 1",
+        "file_end line 2",
+        "file_end line 3",
+        "file1 line 1",
+        "file1 line 2",
+        "file1 line 3",
+        "file1 line 4",
+    ]
+
+    with seamm_util.Open(filepath, "r", include="include") as fd:
+        fd.seek_line(6)
+        assert [line.strip() for line in fd] == data[6:]
+        assert [line.strip() for line in fd[2:5]] == data[2:5]
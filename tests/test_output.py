@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `seamm_util` package, output module."""
+
+import json
+
+from seamm_util.output import Output
+import seamm_util.output
+
+
+def test_flush(tmp_path):
+    """Testing writing and rereading the whole file."""
+    path = str(tmp_path / "output.json.gz")
+    output = Output(path)
+    output["a"] = 1
+    output["b"] = [1, 2, 3]
+    output.flush()
+
+    assert dict(Output(path)) == {"a": 1, "b": [1, 2, 3]}
+
+
+def test_journal(tmp_path):
+    """Testing that only the changes are appended to the journal."""
+    path = tmp_path / "output.json"
+    output = Output(path, journal=True)
+    output["a"] = 1
+    output["b"] = 2
+    output.flush()
+    output["b"] = 3
+    output["c"] = 4
+    del output["a"]
+    output.flush()
+
+    with open(tmp_path / "output.json.journal") as fd:
+        records = [json.loads(line) for line in fd]
+    assert records == [
+        {"set": {"a": 1, "b": 2}},
+        {"set": {"b": 3, "c": 4}, "delete": ["a"]},
+    ]
+    assert dict(Output(path, journal=True)) == {"b": 3, "c": 4}
+
+
+def test_new_file(tmp_path):
+    """Testing that the data is kept when switching to a new file."""
+    path = tmp_path / "a.json"
+    output = Output(path, journal=True)
+    output["x"] = 1
+    output["y"] = 2
+    output.flush()
+
+    output.filename = tmp_path / "b.json"
+    output["z"] = 3
+    output.flush()
+    output = Output(tmp_path / "b.json", journal=True)
+    assert dict(output) == {"x": 1, "y": 2, "z": 3}
+
+
+def test_compact(tmp_path):
+    """Testing compacting the journal into the file."""
+    path = str(tmp_path / "output.json")
+    output = Output(path, journal=True, compact_every=3)
+    for i in range(4):
+        output[str(i)] = i
+        output.flush()
+
+    with open(path) as fd:
+        assert json.load(fd) == {"0": 0, "1": 1, "2": 2}
+    with open(path + ".journal") as fd:
+        assert len(fd.readlines()) == 1
+    assert dict(Output(path, journal=True)) == {"0": 0, "1": 1, "2": 2, "3": 3}
+
+
+def test_torn_record(tmp_path):
+    """Testing that a partial record from a crash is ignored and removed."""
+    path = str(tmp_path / "output.json")
+    output = Output(path, journal=True)
+    output["a"] = 1
+    output.flush()
+    with open(path + ".journal", "a") as fd:
+        fd.write('{"set": {"b"')
+
+    output = Output(path, journal=True)
+    assert dict(output) == {"a": 1}
+    output["c"] = 3
+    output.flush()
+    assert dict(Output(path, journal=True)) == {"a": 1, "c": 3}
+
+
+def test_lazy(tmp_path):
+    """Testing reading values only when they are used."""
+    path = tmp_path / "output.json"
+    data = {"a": 1, "b": {"c": [1, "x, y]}"], "d": {}}, "e": '"quoted" {'}
+    path.write_text(json.dumps(data, indent=4))
+
+    output = Output(path, lazy=True)
+    assert list(output) == ["a", "b", "e"]
+    assert output._data["b"] is not data["b"]
+    assert output["b"] == data["b"]
+    assert output["e"] == data["e"]
+    assert (tmp_path / "output.json.index").exists()
+
+    # Unread values are copied across when writing
+    output = Output(str(path), lazy=True)
+    output["f"] = 6
+    del output["a"]
+    output.flush()
+    data["f"] = 6
+    del data["a"]
+    assert json.loads(path.read_text()) == data
+    assert dict(Output(str(path), lazy=True)) == data
+
+
+def test_lazy_contains(tmp_path):
+    """Testing lazy reading without reading values or writing the index."""
+    path = tmp_path / "output.json"
+    path.write_text(json.dumps({"a": 1, "b": 2}))
+    (tmp_path / "output.json.index").mkdir()
+
+    output = Output(path, lazy=True)
+    assert "a" in output
+    assert "c" not in output
+    assert output._data["a"] is seamm_util.output._UNLOADED
+    assert output["b"] == 2
+
+
+def test_write_behind(tmp_path):
+    """Testing that flushes are gathered and written in the background."""
+    path = tmp_path / "output.json"
+    output = Output(str(path), write_behind=60)
+    for i in range(10):
+        output[str(i)] = i
+        output.flush()
+    # Nothing is written until the window has passed...
+    assert not path.exists()
+
+    # ... unless we wait for it
+    output.flush(wait=True)
+    assert json.loads(path.read_text()) == {str(i): i for i in range(10)}
+    assert list(tmp_path.iterdir()) == [path]
@@ -4,8 +4,15 @@
 """Tests for `seamm_util` package, plotting module."""
 
 from seamm_util import Figure
+from seamm_util.plotting import decode_typed_arrays, lttb, min_max, typed_array
+from seamm_util.plotting import ImageExporter, render_many, write_files
+from seamm_util.plotting import clear_template_cache, get_template
 import jinja2
+import json
+import numpy as np
 import os
+import plotly
+import seamm_util.plotting
 
 # import pytest
 
@@ -163,3 +170,400 @@ def test_writing_plot(tmpdir):
             fd.write(graph)
 
     assert graph == correct_result
+
+
+def test_lttb():
+    """Testing that LTTB keeps the ends and extrema."""
+    x = np.linspace(0.0, 100.0, 100001)
+    y = np.sin(x)
+    y[31234] = 5.0
+    y[70000] = -5.0
+
+    keep = lttb(x, y, 500)
+
+    assert len(keep) <= 502
+    assert keep[0] == 0 and keep[-1] == len(x) - 1
+    assert 31234 in keep and 70000 in keep
+    assert np.all(np.diff(keep) > 0)
+
+
+def test_min_max():
+    """Testing that min/max decimation keeps each bucket's extrema."""
+    rng = np.random.default_rng(0)
+    y = rng.normal(size=10007)
+
+    keep = min_max(y, 100)
+
+    assert len(keep) <= 102
+    assert np.argmin(y) in keep and np.argmax(y) in keep
+    assert keep[0] == 0 and keep[-1] == len(y) - 1
+
+
+def test_decimated_dump():
+    """Testing that large traces are decimated when dumped."""
+    fig = Figure(jinja_env=env, template="line.html_template", title="Decimated")
+    plot = fig.add_plot("Energies")
+    x_axis = plot.add_axis("x", label="Time (ps)")
+    y_axis = plot.add_axis("y", label="Energy (kcal/mol)", anchor=x_axis)
+    x_axis.anchor = y_axis
+
+    y = np.cos(np.linspace(0.0, 50.0, 20000))
+    trace = plot.add_trace(
+        x_axis=x_axis, y_axis=y_axis, name="Total", x0=0, dx=0.5, y=y.tolist()
+    )
+    small = plot.add_trace(
+        x_axis=x_axis, y_axis=y_axis, name="Small", x0=0, dx=1.0, y=[1.0, 2.0]
+    )
+
+    # Nothing happens unless asked for
+    assert fig.dumps() == fig.dumps(max_points=None)
+    assert len(trace.to_dict()["y"]) == 20000
+
+    graph = fig.dumps(max_points=200)
+    assert len(graph) < 20000
+
+    data = trace.to_dict(max_points=200, decimation="minmax")
+    assert len(data["y"]) <= 202
+    assert "x0" not in data and data["x"][-1] == 0.5 * 19999
+    assert small.to_dict(max_points=200)["y"] == [1.0, 2.0]
+
+    # The setting on the trace takes precedence
+    trace.max_points = 10
+    plot.max_points = 1000
+    assert len(fig.dumps(max_points=200)) < len(graph)
+
+
+def test_typed_array():
+    """Testing the round trip through plotly typed arrays."""
+    data = {
+        "f": np.linspace(0.0, 1.0, 7),
+        "i": np.arange(5, dtype=np.int64),
+        "big": np.array([2**40, 1]),
+        "m": np.arange(6.0).reshape(2, 3),
+    }
+    encoded = {key: typed_array(value) for key, value in data.items()}
+    assert encoded["f"]["dtype"] == "f8"
+    assert encoded["i"]["dtype"] == "i4"
+    assert encoded["big"]["dtype"] == "f8"
+    assert encoded["m"]["shape"] == "2, 3"
+
+    decoded = decode_typed_arrays(json.loads(json.dumps(encoded)))
+    for key, value in data.items():
+        assert np.array_equal(decoded[key], value)
+
+
+def test_typed_arrays_in_dump(tmp_path, monkeypatch):
+    """Testing that large traces are written as typed arrays only on request."""
+    fig = Figure(jinja_env=env, template="line.graph_template", title="Typed")
+    plot = fig.add_plot("Energies")
+    x_axis = plot.add_axis("x", label="Time (ps)")
+    y_axis = plot.add_axis("y", label="Energy (kcal/mol)", anchor=x_axis)
+    x_axis.anchor = y_axis
+
+    y = np.cos(np.linspace(0.0, 50.0, 5000))
+    trace = plot.add_trace(
+        x_axis=x_axis, y_axis=y_axis, name="Total", x0=0, dx=0.5, y=list(y)
+    )
+    assert isinstance(trace["y"], np.ndarray)
+
+    plain = fig.dumps()
+    assert '"bdata"' not in plain
+    graph = fig.dumps(typed_arrays=True)
+    assert '"bdata"' in graph
+    assert len(graph) < 0.6 * len(plain)
+
+    # Graph files use plain lists unless asked for typed arrays
+    path = tmp_path / "typed.graph"
+    fig.write_file(path)
+    assert '"bdata"' not in path.read_text()
+    fig.write_file(path, typed_arrays=True)
+    assert '"bdata"' in path.read_text()
+    monkeypatch.setattr(seamm_util.plotting, "graph_typed_arrays", True)
+    write_files([(fig, [path.with_name("default.graph")])])
+    assert '"bdata"' in path.with_name("default.graph").read_text()
+    write_files([(fig, [path.with_name("plain.graph")])], typed_arrays=False)
+    assert '"bdata"' not in path.with_name("plain.graph").read_text()
+
+    # HTML pages load an older Plotly.js, so they get plain lists
+    fig.template = "line.html_template"
+    assert '"bdata"' not in fig.dumps()
+
+    data = trace.to_dict(typed_arrays=True)
+    assert np.array_equal(decode_typed_arrays(data)["y"], y)
+    assert trace.to_dict()["y"] == y.tolist()
+
+
+def graph_figure(title, n=1000, template="line.graph_template"):
+    """A figure using the JSON graph template."""
+    fig = Figure(jinja_env=env, template=template, title=title)
+    plot = fig.add_plot("Energies")
+    x_axis = plot.add_axis("x", label="Time (ps)")
+    y_axis = plot.add_axis("y", label="Energy (kcal/mol)", anchor=x_axis)
+    x_axis.anchor = y_axis
+    plot.add_trace(
+        x_axis=x_axis,
+        y_axis=y_axis,
+        name="Total",
+        x0=0,
+        dx=1.0,
+        y=np.sin(np.linspace(0.0, 10.0, n)),
+    )
+    return fig
+
+
+def test_to_plotly():
+    """Testing conversion of a graph to a plotly figure."""
+    fig = graph_figure("Plotly").to_plotly()
+
+    assert fig.layout.title.text == "Plotly"
+    assert len(fig.data[0].y) == 1000
+
+
+def test_write_files(tmp_path, monkeypatch):
+    """Testing that images for all figures are written in one batch."""
+    calls = []
+
+    def write_images(figs, paths, format=None, **kwargs):
+        calls.append((figs, paths, format))
+
+    monkeypatch.setattr(plotly.io, "write_images", write_images, raising=False)
+    monkeypatch.setattr(seamm_util.plotting, "_kaleido", lambda: None)
+
+    figures = [graph_figure("One"), graph_figure("Two")]
+    jobs = [
+        (fig, [tmp_path / f"{i}.graph", tmp_path / f"{i}.png", tmp_path / f"{i}.pdf"])
+        for i, fig in enumerate(figures)
+    ]
+    write_files(jobs)
+
+    assert len(calls) == 1
+    figs, paths, formats = calls[0]
+    assert [p.name for p in paths] == ["0.png", "0.pdf", "1.png", "1.pdf"]
+    assert formats == ["png", "pdf", "png", "pdf"]
+    # The figure is converted once and shared by its formats
+    assert figs[0] is figs[1] and figs[2] is figs[3]
+    assert figs[0]["layout"]["title"]["text"] == "One"
+    assert json.loads((tmp_path / "1.graph").read_text())["layout"]
+
+    with ImageExporter() as exporter:
+        exporter.add(figures[0], [tmp_path / "0.html"])
+    assert len(calls) == 1
+    assert "plotly" in (tmp_path / "0.html").read_text()
+
+
+def test_render_many(tmp_path):
+    """Testing rendering figures in a pool of processes."""
+    figures = {tmp_path / f"fig{i}": graph_figure(f"Figure {i}") for i in range(3)}
+    figures[tmp_path / "page"] = graph_figure("Page", template="line.html_template")
+
+    timings = render_many(figures, formats=("graph",), max_workers=2, typed_arrays=True)
+
+    assert set(timings) == set(figures)
+    for stem, timing in timings.items():
+        assert timing["total"] >= timing["render"] >= 0.0
+        text = stem.with_suffix(".graph").read_text()
+        assert text == figures[stem].dumps(typed_arrays=True)
+    data = json.loads((tmp_path / "fig1.graph").read_text())
+    assert data["layout"]["title"]["text"] == "Figure 1"
+
+
+def test_render_many_no_environment(tmp_path):
+    """Testing rendering figures without a Jinja environment in processes."""
+    figures = {}
+    for i in range(3):
+        fig = Figure(template=None, title=f"Figure {i}")
+        plot = fig.add_plot("Energies")
+        x_axis = plot.add_axis("x", label="Time (ps)")
+        y_axis = plot.add_axis("y", label="Energy (kcal/mol)", anchor=x_axis)
+        x_axis.anchor = y_axis
+        plot.add_trace(
+            x_axis=x_axis, y_axis=y_axis, name="Total", x0=0, dx=1, y=[1.0, 2.0]
+        )
+        figures[tmp_path / f"fig{i}"] = fig
+    figures[tmp_path / "templated"] = graph_figure("Templated")
+
+    render_many(figures, formats=("graph",), max_workers=2)
+
+    for stem, figure in figures.items():
+        text = stem.with_suffix(".graph").read_text()
+        assert text == figure.dumps()
+    data = json.loads((tmp_path / "fig1.graph").read_text())
+    assert data["layout"]["title"]["text"] == "Figure 1"
+
+
+def test_template_cache():
+    """Testing the cache of compiled templates."""
+    template = get_template(env, "line.graph_template")
+    assert get_template(env, "line.graph_template") is template
+    assert "jsonify" in env.filters
+
+    clear_template_cache()
+    assert env not in seamm_util.plotting._templates
+
+
+def test_trace_view():
+    """Testing that views of traces do not copy the data."""
+    fig = graph_figure("View", n=10)
+    trace = fig.get_plot("Energies")["Total"]
+    trace["text"] = "unchanged"
+
+    view = trace.view()
+    assert view.maps[1] is trace.data
+    assert "text" not in view.maps[0]
+    assert view["y"] == trace["y"].tolist()
+
+
+def test_dump_streams(tmp_path):
+    """Testing that dump writes the same document as dumps."""
+    fig = graph_figure("Stream")
+    fig.dump(tmp_path / "stream.graph")
+
+    assert (tmp_path / "stream.graph").read_text() == fig.dumps()
+
+
+def test_template_free():
+    """Testing the plotly JSON created without a template."""
+    fig = graph_figure("Direct")
+    fig.template = None
+    trace = fig.get_plot("Energies")["Total"]
+    trace.update(color="red", xlabel="t", xunits="ps", showlegend="false")
+
+    data = json.loads(fig.dumps())
+    assert data["layout"]["title"]["text"] == "Direct"
+    assert data["layout"]["yaxis"]["anchor"] == "x"
+    assert data["layout"]["xaxis"]["domain"] == [0.0, 1.0]
+    direct = data["data"][0]
+    assert direct["line"] == {"color": "red"}
+    assert direct["showlegend"] is False
+    assert direct["hovertemplate"].startswith("t=%{x} ps<br>")
+    assert np.array_equal(decode_typed_arrays(direct)["y"], trace["y"])
+
+    plain = json.loads(fig.dumps(typed_arrays=False, max_points=100))
+    assert len(plain["data"][0]["x"]) <= 102
+    assert "x0" not in plain["data"][0]
+
+    figure = fig.to_plotly()
+    assert figure.layout.title.text == "Direct"
+    assert np.array_equal(figure.data[0].y, trace["y"])
+
+
+def test_trace_append():
+    """Testing appending points to a trace."""
+    fig = graph_figure("Append", n=3)
+    trace = fig.get_plot("Energies")["Total"]
+    trace["x"] = [0.0, 1.0, 2.0]
+
+    trace.append(x=3.0, y=0.5)
+    trace.append(x=[4.0, 5.0], y=[0.25, 0.125])
+    assert trace.n_points == 6
+    assert trace["x"].tolist() == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+    assert trace["y"][-3:].tolist() == [0.5, 0.25, 0.125]
+
+    # Appending reuses the spare room in the buffer
+    y = trace["y"]
+    trace.append(x=6.0, y=1.0)
+    assert np.shares_memory(y, trace["y"])
+
+
+def test_update_file(tmp_path):
+    """Testing incremental updates of a graph file."""
+    fig = graph_figure("Live", n=10)
+    plot = fig.get_plot("Energies")
+    total = plot["Total"]
+    axes = plot.axes
+    other = plot.add_trace(
+        x_axis=axes[0], y_axis=axes[1], name="Other", x=[0, 1], y=[1.0, 2.0]
+    )
+    path = tmp_path / "live.graph"
+    patch = tmp_path / "live.graph.patch"
+
+    assert fig.update_file(path, compact_every=2)
+    assert not patch.exists()
+    assert fig.update_file(path, compact_every=2) is False
+    assert not patch.exists()
+
+    total.append(y=[5.0, 6.0])
+    other.append(x=2, y=3.0)
+    assert fig.update_file(path, compact_every=2) is False
+    other.append(x=3, y=4.0)
+    assert fig.update_file(path, compact_every=2) is False
+
+    lines = patch.read_text().splitlines()
+    assert len(lines) == 2
+    first = json.loads(lines[0])
+    assert first == [
+        {"update": {"y": [[5.0, 6.0]]}, "indices": [0]},
+        {"update": {"x": [[2]], "y": [[3.0]]}, "indices": [1]},
+    ]
+    assert json.loads(lines[1]) == [
+        {"update": {"x": [[3]], "y": [[4.0]]}, "indices": [1]}
+    ]
+
+    # The next update compacts the patches into the file
+    total.append(y=7.0)
+    assert fig.update_file(path, compact_every=2)
+    assert not patch.exists()
+    data = decode_typed_arrays(json.loads(path.read_text()))
+    assert data["data"][1]["y"] == [1.0, 2.0, 3.0, 4.0]
+    assert len(data["data"][0]["y"]) == 13
+
+
+def test_update_file_changes(tmp_path):
+    """Testing that changes other than appending rewrite a graph file."""
+    fig = graph_figure("Live", n=5)
+    plot = fig.get_plot("Energies")
+    total = plot["Total"]
+    path = tmp_path / "live.graph"
+    patch = tmp_path / "live.graph.patch"
+
+    assert fig.update_file(path)
+    assert fig.update_file(path) is False
+
+    # Replacing the data, even with more points, is not an append
+    total["y"] = [9.0] * 7
+    assert fig.update_file(path)
+    assert not patch.exists()
+    data = json.loads(path.read_text())
+    assert data["data"][0]["y"] == [9.0] * 7
+
+    total.append(y=8.0)
+    assert fig.update_file(path) is False
+    assert patch.exists()
+
+    fig["title"] = "Changed"
+    assert fig.update_file(path)
+    assert json.loads(path.read_text())["layout"]["title"]["text"] == "Changed"
+
+    plot.axes[0]["label"] = "Time (fs)"
+    assert fig.update_file(path)
+    assert "Time (fs)" in path.read_text()
+    assert fig.update_file(path) is False
+
+
+def test_webgl_promotion():
+    """Testing that large scatter traces are drawn with WebGL."""
+    fig = graph_figure("WebGL", n=2000)
+    plot = fig.get_plot("Energies")
+    axes = plot.axes
+    small = plot.add_trace(
+        x_axis=axes[0], y_axis=axes[1], name="Small", x=[0, 1], y=[1.0, 2.0]
+    )
+
+    data = json.loads(fig.dumps())
+    assert [t["type"] for t in data["data"]] == ["scatter", "scatter"]
+
+    data = json.loads(fig.dumps(webgl_threshold=1000))
+    assert [t["type"] for t in data["data"]] == ["scattergl", "scatter"]
+
+    # Decimated traces are small enough for SVG
+    data = json.loads(fig.dumps(webgl_threshold=1000, max_points=500))
+    assert data["data"][0]["type"] == "scatter"
+
+    # The setting on a trace takes precedence
+    small.webgl = True
+    plot["Total"].webgl = False
+    data = json.loads(fig.dumps(webgl_threshold=1000))
+    assert [t["type"] for t in data["data"]] == ["scatter", "scattergl"]
+
+    fig.template = None
+    assert fig.to_plotly_dict()["data"][1]["type"] == "scattergl"
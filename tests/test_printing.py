@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `seamm_util` package, printing module."""
+
+import logging
+import threading
+
+import pytest
+
+from seamm_util import printing
+
+
+class SlowHandler(logging.Handler):
+    """A handler that records the messages and the thread that wrote them."""
+
+    def __init__(self, delay=None):
+        super().__init__()
+        self.delay = delay
+        self.messages = []
+        self.threads = set()
+
+    def emit(self, record):
+        if self.delay is not None:
+            self.delay.wait(5)
+        self.messages.append(self.format(record))
+        self.threads.add(threading.current_thread())
+
+
+@pytest.fixture
+def printer():
+    """A printer with no handlers, cleaned up afterwards."""
+    result = printing.getPrinter("test_printing")
+    yield result
+    printing.shutdown()
+    result.disabled = False
+    for printer in (result, printing.print_root):
+        for hdlr in list(printer.handlers):
+            printer.removeHandler(hdlr)
+            hdlr.close()
+
+
+def test_queued(printer):
+    """Testing that queued printing returns before the output is written."""
+    delay = threading.Event()
+    handler = SlowHandler(delay)
+    printer.addHandler(handler)
+    printing.basicConfig(queued=True)
+
+    printer.normal("first %d", 1)
+    printer.job("second")
+    assert handler.messages == []
+
+    delay.set()
+    printing.shutdown()
+    assert handler.messages == ["first 1", "second"]
+    assert threading.current_thread() not in handler.threads
+
+    # After shutdown printing is direct again
+    printer.normal("third")
+    assert handler.messages[-1] == "third"
+    assert threading.current_thread() in handler.threads
+
+
+def test_queued_levels(printer):
+    """Testing that the handler levels are respected when queued."""
+    handler = SlowHandler()
+    handler.setLevel(printing.TERSE)
+    printing.basicConfig(queued=True)
+    printer.addHandler(handler)
+
+    printer.normal("normal")
+    printer.important("important")
+    printer.removeHandler(handler)
+    printer.important("removed")
+    printing.shutdown()
+
+    assert handler.messages == ["important"]
+
+
+def test_file_config(printer, tmp_path):
+    """Testing a queued configuration from a file."""
+    log = tmp_path / "print.log"
+    config = tmp_path / "printing.ini"
+    config.write_text(f"""\
+[formatters]
+keys=plain
+
+[formatter_plain]
+format=%(levelname)s: %(message)s
+
+[handlers]
+keys=file
+
+[handler_file]
+class=logging.FileHandler
+formatter=plain
+args=({str(log)!r}, "w")
+
+[loggers]
+keys=root
+
+[printer_root]
+level=NORMAL
+handlers=file
+""")
+    printing.fileConfig(str(config), queued=True)
+
+    # Printers not in the configuration are disabled
+    printer.normal("disabled")
+    printing.print_root.verbose("hidden")
+    printing.print_root.normal("shown")
+    printing.shutdown()
+
+    assert log.read_text() == "INFO: shown\n"
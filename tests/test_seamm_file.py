@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `seamm_util` package, seamm_file module."""
+
+import numpy as np
+import pytest
+
+from seamm_util.seamm_file import ColumnarFile, File, scan_directory, sniff_header
+
+
+def test_atomic_write(tmp_path):
+    """Testing that a failed write leaves the original file."""
+    path = tmp_path / "test.txt"
+    with File(path, "w", filetype="test", version="1.0") as fd:
+        fd.write("first\n")
+    assert path.read_text() == "first\n"
+
+    with pytest.raises(ValueError):
+        with File(path, "w", filetype="test", version="1.0") as fd:
+            fd.write("second\n")
+            raise ValueError("crash")
+    assert path.read_text() == "first\n"
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_write_behind(tmp_path):
+    """Testing that rewrites are gathered into one background write."""
+    path = tmp_path / "test.txt.gz"
+    seamm_file = File(path, "w", filetype="test", version="1.0", write_behind=60)
+    for i in range(5):
+        with seamm_file as fd:
+            fd.write(f"version {i}\n")
+    assert not path.exists()
+
+    seamm_file.flush(wait=True)
+    with File(path, "r") as fd:
+        assert fd.read() == "version 4\n"
+
+
+@pytest.mark.parametrize("compression", ["zlib", "none"])
+def test_columnar(tmp_path, compression):
+    """Testing writing, appending and reading columns."""
+    path = tmp_path / "table.dat"
+    table = ColumnarFile(
+        path,
+        "w",
+        filetype="table",
+        version="1.0",
+        columns={"step": "i8", "energy": "f8"},
+        compression=compression,
+        chunk_rows=4,
+    )
+    table.append(step=range(10), energy=np.arange(10) * 0.5)
+    assert path.read_text(errors="ignore").startswith("!MolSSI table 1.0\n")
+
+    table = ColumnarFile(path, "a")
+    table.append(step=[10, 11], energy=[5.0, 5.5])
+
+    table = ColumnarFile(path)
+    assert (table.filetype, table.version) == ("table", "1.0")
+    assert len(table) == 12
+    assert table.column("step").tolist() == list(range(12))
+    assert table.column("energy", 3, 9).tolist() == [x * 0.5 for x in range(3, 9)]
+    assert list(table.read(["step"], start=-2)) == ["step"]
+
+
+def test_columnar_partial_chunk(tmp_path):
+    """Testing that a partial chunk from a crash is ignored."""
+    path = tmp_path / "table.dat"
+    table = ColumnarFile(
+        path, "w", filetype="table", version="1.0", columns={"x": "f8"}
+    )
+    table.append(x=[1.0, 2.0])
+    with open(path, "ab") as fd:
+        fd.write(ColumnarFile.magic + b"\0" * 5)
+
+    table = ColumnarFile(path, "a")
+    assert table.column("x").tolist() == [1.0, 2.0]
+    table.append(x=[3.0])
+    assert ColumnarFile(path).column("x").tolist() == [1.0, 2.0, 3.0]
+
+
+def test_sniff_header(tmp_path):
+    """Testing reading just the header, using the content for compression."""
+    for name in ("a.txt", "b.txt.gz", "c.txt.bz2"):
+        with File(tmp_path / name, "w", filetype="test", version="1.0") as fd:
+            fd.write("!MolSSI test 1.0\n")
+            fd.write("data\n" * 1000)
+    (tmp_path / "d.txt").write_text("no header\n")
+    (tmp_path / "b.txt.gz").rename(tmp_path / "e.dat")
+
+    assert sniff_header(tmp_path / "a.txt") == ("MolSSI", "test", "1.0", "text")
+    assert sniff_header(tmp_path / "d.txt") is None
+
+    result = scan_directory(tmp_path)
+    assert {p.name: header for p, header in result.items()} == {
+        "a.txt": ("MolSSI", "test", "1.0", "text"),
+        "c.txt.bz2": ("MolSSI", "test", "1.0", "bzip2"),
+        "e.dat": ("MolSSI", "test", "1.0", "gzip"),
+    }
+
+    seamm_file = File(tmp_path / "c.txt.bz2", "a")
+    assert (seamm_file.filetype, seamm_file.version) == ("test", "1.0")
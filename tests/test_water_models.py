@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `seamm_util` package, water_models module."""
+
+import numpy as np
+import pytest
+
+from seamm_util.water_models import find_close, Water
+
+
+def test_find_waters():
+    """Testing finding waters among other molecules."""
+    # Methanol, water, hydroxide and water with the hydrogens first
+    system = {
+        "atoms": {
+            "elements": ["C", "O", "H", "H", "H", "H"]
+            + ["O", "H", "H"]
+            + ["O", "H"]
+            + ["H", "H", "O"],
+        },
+        "bonds": [
+            (1, 2, "single"),
+            (1, 3, "single"),
+            (1, 4, "single"),
+            (1, 5, "single"),
+            (2, 6, "single"),
+            (7, 8, "single"),
+            (9, 7, "single"),
+            (10, 11, "single"),
+            (14, 12, "single"),
+            (13, 14, "single"),
+        ],
+    }
+    waters = Water.find_waters(system)
+    assert waters.shape == (2, 3)
+    assert waters.tolist() == [[6, 7, 8], [13, 11, 12]]
+
+
+def test_find_waters_no_bonds():
+    """Testing a system without any bonds."""
+    system = {"atoms": {"elements": ["O", "H", "H"]}, "bonds": []}
+    waters = Water.find_waters(system)
+    assert waters.shape == (0, 3)
+    assert waters.dtype == np.int64
+
+
+def test_replicate():
+    """Testing making many copies of a water."""
+    model = Water.create_model("tip3p")
+    centers = [[0.0, 0.0, 0.0], [5.0, 0.0, 0.0], [0.0, 5.0, 0.0]]
+    system = model.replicate(centers, seed=42)
+
+    atoms = system["atoms"]
+    xyz = atoms["coordinates"].reshape(-1, 3, 3)
+    assert xyz.shape == (3, 3, 3)
+    assert atoms["elements"].tolist() == ["O", "H", "H"] * 3
+    assert atoms["atom_types"]["*"].tolist() == ["o_tip3p", "h_tip3p", "h_tip3p"] * 3
+    assert atoms["charges"]["*"].sum() == pytest.approx(0.0)
+
+    # The geometry is preserved by the rotations
+    r = np.linalg.norm(xyz[:, 1:, :] - xyz[:, :1, :], axis=2)
+    assert np.allclose(r, model.r0)
+    masses = np.array(model.masses)
+    assert np.allclose(np.einsum("a,nai->ni", masses, xyz) / masses.sum(), centers)
+
+    # And the bonds are correct
+    assert Water.find_waters(system).tolist() == [[0, 1, 2], [3, 4, 5], [6, 7, 8]]
+
+
+def test_fill_box():
+    """Testing filling a box at the density of water."""
+    model = Water.create_model("spc/e")
+    system = model.fill_box([30.0, 30.0, 20.0], seed=1)
+
+    n = len(system["atoms"]["elements"]) // 3
+    assert n == 600
+    assert system["periodicity"] == 3
+    assert system["cell"] == [30.0, 30.0, 20.0, 90.0, 90.0, 90.0]
+    centers = system["atoms"]["coordinates"][::3]
+    assert np.all((centers > -1.0) & (centers < [31.0, 31.0, 21.0]))
+
+
+@pytest.mark.parametrize("cell", [None, [10.0, 12.0, 7.0]])
+def test_find_close(cell):
+    """Testing the cell list against all pairs of distances."""
+    rng = np.random.default_rng(3)
+    points = rng.uniform(0.0, 10.0, size=(500, 3))
+    others = rng.uniform(0.0, 10.0, size=(50, 3))
+
+    delta = points[:, np.newaxis, :] - others[np.newaxis, :, :]
+    if cell is not None:
+        delta -= cell * np.round(delta / cell)
+    expected = (np.linalg.norm(delta, axis=2) < 1.5).any(axis=1)
+
+    close = find_close(points, others, 1.5, cell=cell, chunk_size=64)
+    assert close.tolist() == expected.tolist()
+
+
+def test_solvate():
+    """Testing filling a box around a solute."""
+    model = Water.create_model("spc")
+    solute = [[10.0, 10.0, 10.0], [0.5, 0.5, 0.5]]
+    cell = [20.0, 20.0, 20.0]
+    system = model.solvate(solute, cell, seed=5)
+
+    n = len(system["atoms"]["elements"]) // 3
+    assert 0 < n < len(model.fill_box(cell, seed=5)["atoms"]["elements"]) // 3
+    assert not find_close(system["atoms"]["coordinates"], solute, 2.0, cell).any()
+    assert len(Water.find_waters(system)) == n
+
+
+def test_constraints():
+    """Testing the constraints for all the waters at once."""
+    model = Water.create_model("tip3p")
+    system = model.replicate(np.zeros((4, 3)), seed=7)
+    result = model.constraints(system)
+
+    assert result["pairs"].shape == (12, 2)
+    assert result["pairs"][3:6].tolist() == [[3, 4], [3, 5], [4, 5]]
+    xyz = system["atoms"]["coordinates"]
+    i, j = result["pairs"].T
+    assert np.allclose(np.linalg.norm(xyz[i] - xyz[j], axis=1), result["distances"])
+
+    settle = result["settle"]
+    assert settle["dOH"] == model.r0
+    assert settle["rc"] == pytest.approx(settle["dHH"] / 2)
+    # The center of mass is ra from the O along the two-fold axis
+    masses = np.array(model.masses)
+    com = masses @ xyz[0:3] / masses.sum()
+    assert np.linalg.norm(com - xyz[0]) == pytest.approx(settle["ra"])